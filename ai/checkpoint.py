@@ -0,0 +1,117 @@
+import os
+import random
+import threading
+import numpy as np
+from .genetic import GeneticAlgorithm
+from .evolution_strategies import EvolutionStrategies
+from .neural_network import NeuralNetwork, default_activations
+
+OPTIMIZERS = {
+    'ga': GeneticAlgorithm,
+    'es': EvolutionStrategies
+}
+
+def snapshot(ga):
+    """Copy everything needed to resume an optimizer into a dict of arrays"""
+    np_state = np.random.get_state()
+    py_state = random.getstate()
+    best_genome = ga.best_network.genome.copy() if ga.best_network is not None else np.empty(0)
+    return {
+        'optimizer': np.array(ga.name),
+        'genomes': ga.genomes.copy(),
+        'best_genome': best_genome,
+        'generation': np.int64(ga.generation),
+        'layers': np.array(ga.layers, dtype=np.int64),
+        'activations': np.array(ga.activations),
+        'best_fitness': np.float64(ga.best_fitness),
+        'best_generation': np.int64(ga.best_generation),
+        'np_rng_keys': np_state[1],
+        'np_rng_meta': np.array([np_state[2], np_state[3], np_state[4]]),
+        'py_rng_state': np.array(py_state[1], dtype=np.int64),
+        **ga.state()
+    }
+
+def write_checkpoint(path, arrays):
+    """Write a snapshot as one uncompressed .npz, replacing path atomically"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+def save_checkpoint(path, ga):
+    write_checkpoint(path, snapshot(ga))
+
+def load_checkpoint(path, ga=None):
+    """Restore a checkpoint into ga (or a new optimizer of the kind that wrote it) and return it"""
+    with np.load(path) as data:
+        # Checkpoints from before pluggable optimizers were all written by the GA
+        name = str(data['optimizer']) if 'optimizer' in data else 'ga'
+        if ga is None:
+            ga = OPTIMIZERS[name](population_size=0)
+        elif ga.name != name:
+            raise ValueError(f"{path} was written by the '{name}' optimizer, not '{ga.name}'")
+        # Checkpoints from before configurable topologies only stored the hidden layer size,
+        # and the very first ones not even that: they always held the original 3-6-1 network
+        if 'layers' in data:
+            ga.layers = tuple(int(n) for n in data['layers'])
+            ga.activations = tuple(str(a) for a in data['activations'])
+        else:
+            ga.layers = (3, int(data['hidden_size']) if 'hidden_size' in data else 6, 1)
+            ga.activations = default_activations(ga.layers)
+        genomes = data['genomes']
+        if ga.genome_file:
+            ga.dtype = genomes.dtype
+            # Keep the population in its memory-mapped file
+            ga.population_size = len(genomes)
+            stored = ga.allocate_genomes()
+            stored[:] = genomes
+            genomes = stored
+        ga.load_genomes(genomes)
+        ga.generation = int(data['generation'])
+        ga.load_state(data)
+        ga.best_fitness = float(data['best_fitness'])
+        ga.best_generation = int(data['best_generation'])
+        best_genome = data['best_genome']
+        ga.best_network = NeuralNetwork(ga.layers, ga.activations, best_genome) if len(best_genome) else None
+
+        pos, has_gauss, cached_gaussian = data['np_rng_meta']
+        np.random.set_state(('MT19937', data['np_rng_keys'], int(pos), int(has_gauss), float(cached_gaussian)))
+        random.setstate((3, tuple(int(x) for x in data['py_rng_state']), None))
+    return ga
+
+class CheckpointWriter:
+    """Write checkpoints on a background thread so the frame loop only pays for a snapshot copy.
+
+    If a write is still running when the next checkpoint is submitted, only the
+    newest pending snapshot is kept.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.pending = None
+        self.condition = threading.Condition()
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, ga):
+        arrays = snapshot(ga)
+        with self.condition:
+            self.pending = arrays
+            self.condition.notify()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while self.pending is None and not self.closed:
+                    self.condition.wait()
+                if self.pending is None:
+                    return
+                arrays, self.pending = self.pending, None
+            write_checkpoint(self.path, arrays)
+
+    def close(self):
+        """Flush any pending checkpoint and stop the writer thread"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.thread.join()
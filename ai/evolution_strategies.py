@@ -0,0 +1,93 @@
+import numpy as np
+from .optimizer import Optimizer, NetworkViews
+from .neural_network import genome_size
+
+def centered_ranks(values):
+    """Ranks of values scaled to [-0.5, 0.5], so updates don't depend on the scale of the fitness.
+
+    Tied values share their mean rank; birds that crash at the same pipe would
+    otherwise push the mean in a direction picked by their order in the population.
+    """
+    unique, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    ranks = (np.cumsum(counts) - (counts + 1) / 2)[inverse]
+    return ranks / max(len(values) - 1, 1) - 0.5
+
+class EvolutionStrategies(Optimizer):
+    """OpenAI-style evolution strategies over a single mean genome.
+
+    Every generation samples population_size // 2 Gaussian directions and
+    evaluates the mean moved both ways along each (antithetic pairs); with an
+    odd population the last row is the unperturbed mean. Fitness is replaced
+    by centred ranks, and the mean follows the resulting gradient estimate
+    with Adam.
+    """
+    name = 'es'
+
+    def __init__(self, population_size=50, sigma=1.0, learning_rate=0.1, hidden_size=6, layers=None, activations=None,
+                 dtype=np.float64, genome_file=None):
+        self.sigma = sigma
+        self.learning_rate = learning_rate
+        self.beta1 = 0.9
+        self.beta2 = 0.999
+        super().__init__(population_size, hidden_size, layers, activations, dtype, genome_file)
+
+    def create_population(self):
+        """Start from a random mean genome and sample the first population around it"""
+        size = genome_size(self.layers)
+        self.mean = np.random.randn(size) * 0.1
+        self.adam_m = np.zeros(size)
+        self.adam_v = np.zeros(size)
+        self.adam_t = 0
+        self.genomes = self.allocate_genomes()
+        self.population = NetworkViews(self.genomes, self.layers, self.activations)
+        self.focus_index = None
+        self.sample()
+
+    def sample(self):
+        """Write mean +/- sigma * noise into the genome matrix in place"""
+        n = self.population_size // 2
+        self.noise = self.random_generator().standard_normal((n, len(self.mean)), dtype=self.dtype)
+        for start, stop in self.chunks(n):
+            step = self.sigma * self.noise[start:stop]
+            self.genomes[start:stop] = self.mean + step
+            self.genomes[n + start:n + stop] = self.mean - step
+        self.genomes[2 * n:] = self.mean
+
+    def evolve_population(self, fitness):
+        """Move the mean along the rank-weighted noise with one Adam step and sample the next population"""
+        self.record_best(fitness)
+
+        n = len(self.noise)
+        ranks = centered_ranks(fitness[:2 * n])
+        gradient = (ranks[:n] - ranks[n:]) @ self.noise / (2 * n * self.sigma)
+
+        self.adam_t += 1
+        self.adam_m = self.beta1 * self.adam_m + (1 - self.beta1) * gradient
+        self.adam_v = self.beta2 * self.adam_v + (1 - self.beta2) * gradient ** 2
+        m_hat = self.adam_m / (1 - self.beta1 ** self.adam_t)
+        v_hat = self.adam_v / (1 - self.beta2 ** self.adam_t)
+        self.mean += self.learning_rate * m_hat / (np.sqrt(v_hat) + 1e-8)
+
+        self.sample()
+        self.generation += 1
+        self.focus_index = None
+
+    def state(self):
+        return {
+            'mean': self.mean.copy(),
+            'noise': self.noise.copy(),
+            'adam_m': self.adam_m.copy(),
+            'adam_v': self.adam_v.copy(),
+            'adam_t': np.int64(self.adam_t),
+            'sigma': np.float64(self.sigma),
+            'learning_rate': np.float64(self.learning_rate)
+        }
+
+    def load_state(self, data):
+        self.mean = data['mean'].copy()
+        self.noise = data['noise'].copy()
+        self.adam_m = data['adam_m'].copy()
+        self.adam_v = data['adam_v'].copy()
+        self.adam_t = int(data['adam_t'])
+        self.sigma = float(data['sigma'])
+        self.learning_rate = float(data['learning_rate'])
@@ -1,101 +1,75 @@
 import numpy as np
-from .neural_network import NeuralNetwork
+from .optimizer import Optimizer
+from .selection import top_k, truncation_selection, tournament_selection, proportional_selection
 
-class GeneticAlgorithm:
-    def __init__(self, population_size=10, top_units=4):
-        self.population_size = population_size
+class GeneticAlgorithm(Optimizer):
+    name = 'ga'
+    
+    def __init__(self, population_size=10, top_units=4, hidden_size=6, selection='truncation', tournament_size=3,
+                 layers=None, activations=None, dtype=np.float64, genome_file=None):
         self.top_units = top_units
-        self.generation = 1
+        # How parents are picked; the top_units fittest are always carried over unchanged
+        self.selection = selection
+        self.tournament_size = tournament_size
         self.mutation_rate = 0.2
-        
-        self.best_fitness = 0
-        self.best_network = None
-        self.best_generation = 0
-        
-        self.population = []
-        self.create_population()
+        super().__init__(population_size, hidden_size, layers, activations, dtype, genome_file)
     
-    def create_population(self):
-        """Create initial population of neural networks"""
-        self.population = []
-        for _ in range(self.population_size):
-            self.population.append(NeuralNetwork())
-    
-    def evolve_population(self, birds):
-        """Evolve population based on fitness scores"""
-        sorted_birds = sorted(birds, key=lambda x: x.fitness, reverse=True)
-        
-        best_bird = sorted_birds[0]
-        if best_bird.fitness > self.best_fitness:
-            self.best_fitness = best_bird.fitness
-            self.best_generation = self.generation
-            self.best_network = self.population[best_bird.index].copy()
-            print(f"New best fitness: {self.best_fitness:.0f} in generation {self.generation}")
+    def evolve_population(self, fitness):
+        """Build the next generation in place from a fitness value per genome"""
+        elites = top_k(fitness, self.top_units)
+        self.record_best(fitness)
+        
+        n_elites = len(elites)
+        n_children = self.population_size - n_elites
+        parents = np.empty((2, 0), dtype=np.int64)
+        if n_children > 0:
+            parents = self.select_parents(fitness, n_children)
+            # The first child always comes from the two fittest networks
+            parents[:, 0] = elites[:2]
+        
+        # Children overwrite rows that may still be parents, so copy out every genome that is needed first;
+        # with truncation selection that is only the top_units fittest
+        needed, inverse = np.unique(np.concatenate([elites, parents.ravel()]), return_inverse=True)
+        pool = self.genomes[needed]
+        parents = inverse[n_elites:].reshape(2, -1)
+        
+        # Write into the existing buffer so the network views stay valid, a chunk of rows at a time
+        self.genomes[:n_elites] = pool[inverse[:n_elites]]
+        rng = self.random_generator()
+        for start, stop in self.chunks(n_children):
+            children = self.crossover(pool[parents[0, start:stop]], pool[parents[1, start:stop]], rng)
+            self.genomes[n_elites + start:n_elites + stop] = self.mutate(children, rng)
         
-        winners = [self.population[bird.index] for bird in sorted_birds[:self.top_units]]
-        
-        new_population = []
-        
-        new_population.extend(winners)
-        
-        while len(new_population) < self.population_size:
-            if len(new_population) == self.top_units:
-                parent1, parent2 = winners[0], winners[1]
-            else:
-                parent1 = np.random.choice(winners)
-                parent2 = np.random.choice(winners)
-            
-            offspring = self.crossover(parent1, parent2)
-            offspring = self.mutate(offspring)
-            new_population.append(offspring)
-        
-        self.population = new_population
         self.generation += 1
-        
-        if self.mutation_rate == 1.0 and sorted_birds[0].fitness > 0:
-            self.mutation_rate = 0.2
+        self.focus_index = None
     
-    def crossover(self, parent1, parent2):
-        """Perform crossover between two parent networks"""
-        child = NeuralNetwork()
-        weights1 = parent1.get_weights()
-        weights2 = parent2.get_weights()
-        
-        new_weights = {}
-        for key in weights1:
-            shape = weights1[key].shape
-            mask = np.random.rand(*shape) > 0.5
-            new_weights[key] = np.where(mask, weights1[key], weights2[key])
-        
-        child.set_weights(new_weights)
-        return child
+    def select_parents(self, fitness, n_pairs):
+        """(2, n_pairs) population indices of the parents of every child"""
+        if self.selection == 'tournament':
+            return tournament_selection(fitness, n_pairs, self.tournament_size)
+        if self.selection == 'proportional':
+            return proportional_selection(fitness, n_pairs)
+        return truncation_selection(fitness, n_pairs, self.top_units)
     
-    def mutate(self, network):
-        """Apply random mutations to the network"""
-        weights = network.get_weights()
-        
-        for key in weights:
-            mutation_mask = np.random.rand(*weights[key].shape) < self.mutation_rate
-            mutation = np.random.randn(*weights[key].shape) * 0.1
-            weights[key] = np.where(mutation_mask, weights[key] + mutation, weights[key])
-        
-        network.set_weights(weights)
-        return network
+    def crossover(self, parents1, parents2, rng):
+        """Uniform crossover between two (N, G) genome matrices"""
+        mask = rng.random(parents1.shape, dtype=self.dtype) > 0.5
+        return np.where(mask, parents1, parents2)
     
-    def activate_brain(self, bird, pipe):
-        """Get neural network output for a bird"""
-        if not pipe:
-            return
-        
-        horizontal_distance = (pipe.x + pipe.width - bird.x) / 300
-        height_difference = (bird.y - (pipe.gap_y + pipe.gap_height/2)) / 200
-        velocity = bird.velocity / 8
-        
-        network = self.population[bird.index]
-        output = network.forward([horizontal_distance, height_difference, velocity])
-           
-        bird.current_inputs = [horizontal_distance, height_difference, velocity]
-        bird.current_output = output
-        
-        if output > 0.5:
-            bird.flap() 
\ No newline at end of file
+    def mutate(self, genomes, rng):
+        """Apply Gaussian mutations to an (N, G) genome matrix in place"""
+        noise = rng.standard_normal(genomes.shape, dtype=self.dtype)
+        noise *= 0.1
+        noise[rng.random(genomes.shape, dtype=self.dtype) >= self.mutation_rate] = 0
+        genomes += noise
+        return genomes
+    
+    def state(self):
+        return {
+            'top_units': np.int64(self.top_units),
+            'mutation_rate': np.float64(self.mutation_rate)
+        }
+    
+    def load_state(self, data):
+        self.top_units = int(data['top_units'])
+        self.mutation_rate = float(data['mutation_rate'])
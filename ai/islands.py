@@ -0,0 +1,140 @@
+import multiprocessing
+import time
+import numpy as np
+from game.engine import GameEngine
+from .genetic import GeneticAlgorithm
+from .neural_network import NeuralNetwork
+
+def _island(conn, island, seed, max_steps, ga_options, engine_options):
+    """Worker loop: evolve each received genome slice for the requested generations and send it back"""
+    ga = GeneticAlgorithm(population_size=0, **ga_options)
+    engine = GameEngine(genetic_algorithm=ga, seed=seed, **engine_options)
+
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        genomes, generation, count, epoch_seed = message
+        # Seeded per epoch by the coordinator, whose own RNG state is checkpointed, so --resume replays it
+        np.random.seed([epoch_seed, island])
+        ga.load_genomes(genomes)
+        ga.generation = generation
+
+        history = []
+        for _ in range(count):
+            start = time.perf_counter()
+            engine.spawn_population()
+            engine.run(max_steps)
+            fitness, score, survival_steps = engine.genome_stats()
+            ga.evolve_population(fitness)
+            history.append((fitness, score, survival_steps, time.perf_counter() - start))
+
+        best_genome = ga.best_network.genome if ga.best_network is not None else None
+        conn.send((ga.genomes, history, ga.best_fitness, ga.best_generation, best_genome))
+    conn.close()
+
+class IslandModel:
+    """Evolve a GeneticAlgorithm's population as separate islands, one worker process each.
+
+    The population is split into one slice per island, and every island
+    evolves its slice on its own for migration_interval generations (an epoch).
+    Between epochs the coordinator collects all slices back into ga, copies
+    the best `migrants` genomes of every island over the last children of the
+    next island in a ring, and updates ga.best_network with the global best.
+    Since ga always holds the whole population and every epoch's random
+    streams are seeded from the global NumPy RNG, checkpoints and --resume
+    work as they do for a single population.
+    """
+    def __init__(self, ga, islands=4, migration_interval=5, migrants=2, seed=0, max_steps=20000, **engine_options):
+        self.ga = ga
+        self.islands = islands
+        self.migration_interval = migration_interval
+        # Migrants are taken from the elites an island carried over, so at most top_units of them
+        self.migrants = min(migrants, ga.top_units)
+        self.bounds = np.linspace(0, ga.population_size, islands + 1).astype(int)
+
+        ga_options = {
+            'top_units': ga.top_units,
+            'layers': ga.layers,
+            'activations': ga.activations,
+            'selection': ga.selection,
+            'tournament_size': ga.tournament_size
+        }
+        self.connections = []
+        self.processes = []
+        for island in range(islands):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_island, args=(child_conn, island, seed, max_steps, ga_options, engine_options), daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+
+    def generations(self, count):
+        """Evolve every island for count generations, migrating between epochs.
+
+        Yields (generation, fitness, score, survival steps, wall time, best
+        fitness so far) for the whole population, one generation at a time, as
+        each epoch completes. ga.best_fitness already holds the epoch's best by
+        then, so the running best is yielded for every generation instead.
+        """
+        ga = self.ga
+        while count > 0:
+            epoch = min(count, self.migration_interval)
+            epoch_seed = np.random.randint(2**31)
+            for conn, start, stop in zip(self.connections, self.bounds[:-1], self.bounds[1:]):
+                conn.send((ga.genomes[start:stop], ga.generation, epoch, epoch_seed))
+            replies = [conn.recv() for conn in self.connections]
+
+            best = ga.best_fitness
+            # Copy into the existing buffer so the network views stay valid
+            ga.genomes[:] = np.concatenate([reply[0] for reply in replies])
+            for _, _, best_fitness, best_generation, best_genome in replies:
+                if best_genome is not None and best_fitness > ga.best_fitness:
+                    ga.best_fitness = best_fitness
+                    ga.best_generation = best_generation
+                    ga.best_network = NeuralNetwork(ga.layers, ga.activations, best_genome)
+            self.migrate()
+
+            first = ga.generation
+            ga.generation += epoch
+            ga.focus_index = None
+            count -= epoch
+            for i in range(epoch):
+                stats = [reply[1][i] for reply in replies]
+                fitness = np.concatenate([s[0] for s in stats])
+                best = max(best, fitness.max())
+                yield (
+                    first + i,
+                    fitness,
+                    np.concatenate([s[1] for s in stats]),
+                    np.concatenate([s[2] for s in stats]),
+                    max(s[3] for s in stats),
+                    best
+                )
+
+    def migrate(self):
+        """Copy each island's best genomes over the last children of the next island in the ring"""
+        if self.islands < 2 or self.migrants == 0:
+            return
+        genomes = self.ga.genomes
+        # Every island keeps its elites, fittest first, at the front of its slice
+        emigrants = [genomes[start:start + self.migrants].copy() for start in self.bounds[:-1]]
+        for island, stop in enumerate(self.bounds[1:]):
+            genomes[stop - self.migrants:stop] = emigrants[island - 1]
+
+    def close(self):
+        for conn in self.connections:
+            conn.send(None)
+        for process in self.processes:
+            process.join()
+        for conn in self.connections:
+            conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,53 +1,106 @@
 import numpy as np
 
+def sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+def relu(x):
+    return np.maximum(x, 0)
+
+ACTIVATIONS = {
+    'sigmoid': sigmoid,
+    'tanh': np.tanh,
+    'relu': relu
+}
+
+def default_activations(layers):
+    """Sigmoid for every layer, as in the original 3-6-1 network"""
+    return ('sigmoid',) * (len(layers) - 1)
+
+def genome_size(layers=(3, 6, 1)):
+    """Number of floats in a flat genome: the weights and biases of every layer laid out back to back"""
+    return sum(n_in * n_out + n_out for n_in, n_out in zip(layers[:-1], layers[1:]))
+
+def unpack_genome(genome, layers=(3, 6, 1)):
+    """Split a genome (G,) or genome matrix (P, G) into [w1, b1, w2, b2, ...] views without copying"""
+    lead = genome.shape[:-1]
+    views = []
+    start = 0
+    for n_in, n_out in zip(layers[:-1], layers[1:]):
+        for shape in ((n_in, n_out), (n_out,)):
+            size = int(np.prod(shape))
+            views.append(genome[..., start:start + size].reshape(lead + shape))
+            start += size
+    return views
+
+def batch_forward(params, inputs, activations=None):
+    """Forward pass for a stack of networks at once.
+
+    params is [w1, b1, w2, b2, ...] with weights (P, in, out) and biases
+    (P, out), as returned by unpack_genome for a genome matrix, and inputs is
+    (P, in). Returns the activations of every hidden layer and the first output
+    of every network (P,).
+    """
+    n_layers = len(params) // 2
+    activations = activations or ('sigmoid',) * n_layers
+    x = inputs
+    hidden = []
+    for layer in range(n_layers):
+        weights, bias = params[2 * layer], params[2 * layer + 1]
+        x = ACTIVATIONS[activations[layer]](np.matmul(x[:, None, :], weights)[:, 0] + bias)
+        hidden.append(x)
+    return hidden[:-1], x[:, 0]
+
 class NeuralNetwork:
-    def __init__(self, input_size=3, hidden_size=6, output_size=1):
-        self.input_size = input_size
-        self.hidden_size = hidden_size
-        self.output_size = output_size
-        
-        self.weights1 = np.random.randn(input_size, hidden_size) * 0.1
-        self.weights2 = np.random.randn(hidden_size, output_size) * 0.1
-        self.bias1 = np.random.randn(hidden_size) * 0.1
-        self.bias2 = np.random.randn(output_size) * 0.1
-    
+    def __init__(self, layers=(3, 6, 1), activations=None, genome=None):
+        self.layers = tuple(layers)
+        self.activations = tuple(activations or default_activations(self.layers))
+        self.input_size = self.layers[0]
+        self.output_size = self.layers[-1]
+
+        # Weights are views into one flat genome, which may be a row of a population matrix
+        if genome is None:
+            genome = np.random.randn(genome_size(self.layers)) * 0.1
+        self.genome = genome
+        params = unpack_genome(genome, self.layers)
+        self.weights = params[0::2]
+        self.biases = params[1::2]
+
     def sigmoid(self, x):
-        return 1 / (1 + np.exp(-x))
-    
+        return sigmoid(x)
+
     def forward(self, inputs):
         x = np.array(inputs)
 
-        hidden = self.sigmoid(np.dot(x, self.weights1) + self.bias1)
+        hidden = []
+        for weights, bias, activation in zip(self.weights, self.biases, self.activations):
+            x = ACTIVATIONS[activation](np.dot(x, weights) + bias)
+            hidden.append(x)
+
+        self.last_hidden_activations = hidden[:-1]
+        self.last_output = x[0]
+
+        return x[0]
+
+    def forward_batch(self, inputs):
+        """First output of this network for every row of an (N, in) input matrix"""
+        x = inputs
+        for weights, bias, activation in zip(self.weights, self.biases, self.activations):
+            x = ACTIVATIONS[activation](x @ weights + bias)
+        return x[:, 0]
 
-        output = self.sigmoid(np.dot(hidden, self.weights2) + self.bias2)
-        
-        self.last_hidden_activations = hidden
-        self.last_output = output[0]
-        
-        return output[0]  
-    
     def get_weights(self):
         return {
-            'w1': self.weights1,
-            'w2': self.weights2,
-            'b1': self.bias1,
-            'b2': self.bias2
+            'weights': self.weights,
+            'biases': self.biases
         }
-    
+
     def set_weights(self, weights):
-        self.weights1 = weights['w1']
-        self.weights2 = weights['w2']
-        self.bias1 = weights['b1']
-        self.bias2 = weights['b2'] 
-    
+        """Copy weights into the genome so views held by the population stay valid"""
+        for dst, src in zip(self.weights, weights['weights']):
+            dst[...] = src
+        for dst, src in zip(self.biases, weights['biases']):
+            dst[...] = src
+
     def copy(self):
         """Create a deep copy of the neural network"""
-        new_network = NeuralNetwork(self.input_size, self.hidden_size, self.output_size)
-        weights = self.get_weights()
-        new_network.set_weights({
-            'w1': weights['w1'].copy(),
-            'w2': weights['w2'].copy(),
-            'b1': weights['b1'].copy(),
-            'b2': weights['b2'].copy()
-        })
-        return new_network
\ No newline at end of file
+        return NeuralNetwork(self.layers, self.activations, self.genome.copy())
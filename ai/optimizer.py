@@ -0,0 +1,160 @@
+from abc import ABC, abstractmethod
+import numpy as np
+from .neural_network import NeuralNetwork, batch_forward, default_activations, genome_size, unpack_genome
+
+class NetworkViews:
+    """Sequence of NeuralNetwork views over the rows of a genome matrix, built on first access"""
+    def __init__(self, genomes, layers=(3, 6, 1), activations=None):
+        self.genomes = genomes
+        self.layers = layers
+        self.activations = activations
+        self.networks = {}
+
+    def __len__(self):
+        return len(self.genomes)
+
+    def __getitem__(self, index):
+        index = range(len(self.genomes))[index]
+        network = self.networks.get(index)
+        if network is None:
+            network = self.networks[index] = NeuralNetwork(self.layers, self.activations, self.genomes[index])
+        return network
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+# Rows of the genome matrix processed at once by chunked operations, sized so a float64 temporary stays near 4 MB
+CHUNK_BYTES = 1 << 22
+
+class Optimizer(ABC):
+    """A population of networks stored as one (P, G) genome matrix.
+
+    Holds everything the engine, evaluators and checkpoints need: the genome
+    matrix with its network views, batched inference and best-network
+    tracking. Subclasses implement evolve_population(fitness), which rewrites
+    self.genomes in place for the next generation, and state()/load_state()
+    for whatever else a checkpoint needs to resume them.
+    """
+    name = None
+
+    def __init__(self, population_size=10, hidden_size=6, layers=None, activations=None, dtype=np.float64,
+                 genome_file=None):
+        self.population_size = population_size
+        # Layer sizes from inputs to output; hidden_size is shorthand for the original 3-H-1 network
+        self.layers = tuple(layers) if layers else (3, hidden_size, 1)
+        self.activations = tuple(activations) if activations else default_activations(self.layers)
+        self.generation = 1
+        # Genomes are stored as dtype, in a np.memmap of genome_file when one is given
+        self.dtype = np.dtype(dtype)
+        self.genome_file = genome_file
+
+        self.best_fitness = 0
+        self.best_network = None
+        self.best_generation = 0
+
+        self.genomes = None
+        self.population = []
+        # Index of the network whose last inputs/activations the visualizer shows
+        self.focus_index = None
+        self.create_population()
+
+    def create_population(self):
+        """Create initial population as one (P, G) genome matrix with a network view per row"""
+        self.genomes = self.allocate_genomes()
+        # Drawn in chunks so a float32 store never holds a full float64 copy; the random stream is the same
+        for start, stop in self.chunks(self.population_size):
+            self.genomes[start:stop] = np.random.randn(stop - start, self.genomes.shape[1]) * 0.1
+        self.population = NetworkViews(self.genomes, self.layers, self.activations)
+        self.focus_index = None
+
+    def allocate_genomes(self):
+        """Uninitialized (P, G) genome matrix of self.dtype, in memory or in genome_file"""
+        shape = (self.population_size, genome_size(self.layers))
+        if self.genome_file and self.population_size:
+            return np.memmap(self.genome_file, dtype=self.dtype, mode='w+', shape=shape)
+        return np.empty(shape, dtype=self.dtype)
+
+    def chunks(self, rows):
+        """(start, stop) bounds covering rows genome rows, CHUNK_BYTES of float64 at a time"""
+        step = max(1, CHUNK_BYTES // (8 * genome_size(self.layers)))
+        return [(start, min(start + step, rows)) for start in range(0, rows, step)]
+
+    def random_generator(self):
+        """A Generator seeded from the global NumPy RNG, which checkpoints restore, that can draw in self.dtype"""
+        return np.random.default_rng(np.random.randint(2**31, size=4))
+
+    def load_genomes(self, genomes):
+        """Adopt an existing (P, G) genome matrix, e.g. one backed by shared memory, as the population"""
+        self.population_size = len(genomes)
+        self.genomes = genomes
+        self.dtype = genomes.dtype
+        self.population = NetworkViews(self.genomes, self.layers, self.activations)
+        self.focus_index = None
+
+    @abstractmethod
+    def evolve_population(self, fitness):
+        """Build the next generation in place from a fitness value per genome"""
+
+    def record_best(self, fitness):
+        """Keep a copy of the fittest network seen so far"""
+        best = np.argmax(fitness)
+        if fitness[best] > self.best_fitness:
+            self.best_fitness = fitness[best]
+            self.best_generation = self.generation
+            self.best_network = self.population[best].copy()
+
+    def state(self):
+        """Optimizer-specific arrays stored in a checkpoint"""
+        return {}
+
+    def load_state(self, data):
+        pass
+
+    def stack_population(self):
+        """Views of the genome matrix as [(P, in, out) weights, (P, out) biases] for every layer"""
+        return unpack_genome(self.genomes, self.layers)
+
+    def activate_population(self, population, pipe, next_pipe=None):
+        """Decide flaps for every live bird in a BirdPopulation with one batched forward pass.
+
+        Networks with 5 inputs also see the distance and height difference to next_pipe.
+        """
+        if not pipe:
+            return
+
+        slots = population.active
+        if len(slots) == 0:
+            return
+
+        courses = population.course[slots]
+        inputs = np.zeros((len(slots), self.layers[0]))
+        inputs[:, 0] = (pipe.x + pipe.width - population.x) / 300
+        inputs[:, 1] = (population.y[slots] - (pipe.gap_ys[courses] + pipe.gap_height/2)) / 200
+        inputs[:, 2] = population.velocity[slots] / 8
+        if self.layers[0] >= 5 and next_pipe:
+            inputs[:, 3] = (next_pipe.x + next_pipe.width - population.x) / 300
+            inputs[:, 4] = (population.y[slots] - (next_pipe.gap_ys[courses] + next_pipe.gap_height/2)) / 200
+
+        genomes = population.index[slots]
+        # When every network flies exactly once, in order, the store is used as is instead of gathered
+        identity = (
+            len(genomes) == len(self.genomes) and genomes[0] == 0 and genomes[-1] == len(genomes) - 1
+            and np.all(genomes[1:] > genomes[:-1])
+        )
+        stack = self.stack_population()
+        output = np.empty(len(slots))
+        for start, stop in self.chunks(len(slots)):
+            rows = slice(start, stop) if identity else genomes[start:stop]
+            params = [param[rows] for param in stack]
+            layer_outputs, output[start:stop] = batch_forward(params, inputs[start:stop], self.activations)
+            if start == 0:
+                hidden = layer_outputs
+
+        # The visualizer shows the first live bird's network; copies, so the batch arrays can be freed
+        self.focus_index = genomes[0]
+        focus = self.population[self.focus_index]
+        focus.last_inputs = inputs[0].copy()
+        focus.last_hidden_activations = [layer[0].copy() for layer in hidden]
+        focus.last_output = output[0]
+
+        population.velocity[slots[output > 0.5]] = population.flap_strength
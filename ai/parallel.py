@@ -0,0 +1,120 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from game.engine import GameEngine
+from .genetic import GeneticAlgorithm
+
+# Per-worker view of the shared genome matrix, attached once by the pool initializer
+_worker = {}
+
+def _attach(name, shape, dtype):
+    # Pool workers share the parent's resource tracker, so the parent's unlink covers this attach too
+    shm = shared_memory.SharedMemory(name=name)
+    _worker['shm'] = shm
+    _worker['genomes'] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def _evaluate_slice(indices, generation, layers, activations, seed, max_steps, decision_interval, fitness, courses,
+                    fixed_course):
+    """Run one headless generation for genomes[indices] and return their fitness, score and survival steps"""
+    ga = GeneticAlgorithm(population_size=0, layers=layers, activations=activations)
+    ga.load_genomes(_worker['genomes'][indices])
+    ga.generation = generation
+
+    engine = GameEngine(
+        genetic_algorithm=ga, seed=seed, decision_interval=decision_interval, fitness=fitness, courses=courses,
+        fixed_course=fixed_course
+    )
+    engine.spawn_population()
+    engine.run(max_steps)
+    return indices, engine.genome_stats()
+
+class ParallelEvaluator:
+    """Evaluate an optimizer's population on a process pool.
+
+    The genome matrix is moved into shared memory, so the optimizer evolves it in
+    place and workers read it without any pickling. Every bird only depends on
+    its genome and the generation's seeded course, so fitness is identical for
+    any number of workers. With a cache, genomes it already holds for this
+    course are answered in the parent and never sent to a worker.
+
+    Every slice runs its own engine, whose per-step Python overhead is paid
+    once per slice, so by default each worker gets one contiguous slice.
+    More chunks_per_worker only help when slices finish at very different times.
+    """
+    def __init__(self, ga, workers=None, seed=0, max_steps=20000, decision_interval=1, fitness=None,
+                 courses=1, fixed_course=False, cache=None, chunks_per_worker=1):
+        self.ga = ga
+        self.workers = workers or os.cpu_count()
+        self.seed = seed
+        self.max_steps = max_steps
+        self.decision_interval = decision_interval
+        self.fitness = fitness
+        self.courses = courses
+        self.fixed_course = fixed_course
+        self.cache = cache
+        self.chunks = self.workers * chunks_per_worker
+
+        shape, dtype = ga.genomes.shape, ga.genomes.dtype
+        self.shm = shared_memory.SharedMemory(create=True, size=ga.genomes.nbytes)
+        genomes = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+        genomes[:] = ga.genomes
+        ga.load_genomes(genomes)
+
+        self.pool = ProcessPoolExecutor(
+            self.workers, initializer=_attach, initargs=(self.shm.name, shape, dtype)
+        )
+
+    def evaluate(self):
+        """Fitness, score and survival steps of every genome in the current generation"""
+        size = self.ga.population_size
+        fitness = np.empty(size)
+        score = np.empty(size)
+        distance = np.empty(size)
+
+        todo = np.arange(size)
+        keys = {}
+        if self.cache is not None:
+            course_seed = self.seed if self.fixed_course else self.seed + self.ga.generation
+            misses = []
+            for i in todo:
+                key = self.cache.key(self.ga.genomes[i], course_seed)
+                result = self.cache.get(key)
+                if result is None:
+                    keys[i] = key
+                    misses.append(i)
+                else:
+                    fitness[i], score[i], distance[i] = result
+            todo = np.array(misses, dtype=np.int64)
+
+        chunks = np.array_split(todo, min(self.chunks, len(todo))) if len(todo) else []
+        futures = [
+            self.pool.submit(
+                _evaluate_slice, indices, self.ga.generation, self.ga.layers, self.ga.activations, self.seed,
+                self.max_steps, self.decision_interval, self.fitness, self.courses, self.fixed_course
+            )
+            for indices in chunks
+        ]
+
+        for future in futures:
+            indices, (slice_fitness, slice_score, slice_distance) = future.result()
+            fitness[indices] = slice_fitness
+            score[indices] = slice_score
+            distance[indices] = slice_distance
+            if self.cache is not None:
+                for i in indices:
+                    self.cache.put(keys[i], (fitness[i], score[i], distance[i]))
+        return fitness, score, distance
+
+    def close(self):
+        self.pool.shutdown()
+        # Hand the optimizer a private copy before the shared block goes away
+        self.ga.load_genomes(self.ga.genomes.copy())
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,122 @@
+import asyncio
+import struct
+import time
+import numpy as np
+
+# On connect the server sends the network's input count; every request is then that many
+# little-endian float32 inputs, normalized as in activate_population, and every reply one byte: 1 = flap
+HEADER = struct.Struct('<I')
+INPUT_DTYPE = np.dtype('<f4')
+
+def latency_summary(latencies):
+    """(p50, p99) of latencies in seconds, in milliseconds"""
+    if not latencies:
+        return 0.0, 0.0
+    ms = np.array(latencies) * 1000
+    return np.percentile(ms, 50), np.percentile(ms, 99)
+
+class PolicyServer:
+    """Answer flap decisions for many game clients with micro-batched forward passes.
+
+    Requests from all connections are queued and run through the network
+    together: a batch starts as soon as one request is waiting, and waits up to
+    max_wait seconds for more unless max_batch requests arrive first. Replies
+    keep the order requests were sent in, so clients may pipeline.
+    """
+    def __init__(self, network, max_batch=256, max_wait=0.001):
+        self.network = network
+        self.n_inputs = network.input_size
+        self.request_size = self.n_inputs * INPUT_DTYPE.itemsize
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+
+        self.pending = []
+        self.ready = asyncio.Event()
+        self.full = asyncio.Event()
+
+        # Counters since the last report
+        self.requests = 0
+        self.batches = 0
+        self.latencies = []
+
+    async def handle(self, reader, writer):
+        """Read requests from one client until it disconnects"""
+        writer.write(HEADER.pack(self.n_inputs))
+        try:
+            while True:
+                data = await reader.readexactly(self.request_size)
+                self.pending.append((data, writer, time.perf_counter()))
+                self.ready.set()
+                if len(self.pending) >= self.max_batch:
+                    self.full.set()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def batch_loop(self):
+        while True:
+            await self.ready.wait()
+            if len(self.pending) < self.max_batch and self.max_wait > 0:
+                try:
+                    await asyncio.wait_for(self.full.wait(), self.max_wait)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = self.pending[:self.max_batch]
+            del self.pending[:self.max_batch]
+            if not self.pending:
+                self.ready.clear()
+            if len(self.pending) < self.max_batch:
+                self.full.clear()
+            self.run_batch(batch)
+            # Let the readers queue up the next batch
+            await asyncio.sleep(0)
+
+    def run_batch(self, batch):
+        inputs = np.frombuffer(b''.join(data for data, _, _ in batch), INPUT_DTYPE).reshape(len(batch), self.n_inputs)
+        flaps = (self.network.forward_batch(inputs.astype(np.float64)) > 0.5).astype(np.uint8)
+
+        # Group replies per client, in request order, so each gets one write
+        replies = {}
+        for (_, writer, _), flap in zip(batch, flaps.tobytes()):
+            replies.setdefault(writer, bytearray()).append(flap)
+        for writer, reply in replies.items():
+            if not writer.is_closing():
+                writer.write(reply)
+
+        done = time.perf_counter()
+        self.latencies.extend(done - received for _, _, received in batch)
+        self.requests += len(batch)
+        self.batches += 1
+
+    async def report_loop(self, interval):
+        """Print throughput, mean batch size and p50/p99 latency every interval seconds"""
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(interval)
+            now = time.perf_counter()
+            if self.requests:
+                p50, p99 = latency_summary(self.latencies)
+                print(
+                    f"{self.requests / (now - last):,.0f} req/s, mean batch {self.requests / self.batches:.1f}, "
+                    f"latency p50 {p50:.2f} ms p99 {p99:.2f} ms"
+                )
+            self.requests = 0
+            self.batches = 0
+            self.latencies = []
+            last = now
+
+    async def serve(self, host='127.0.0.1', port=5000, unix_path=None, report_interval=5.0):
+        """Listen on a Unix socket if unix_path is given, else on host:port, until cancelled"""
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle, unix_path)
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+        tasks = [asyncio.create_task(self.batch_loop()), asyncio.create_task(self.report_loop(report_interval))]
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,172 @@
+import numpy as np
+from game.engine import GameEngine
+from .genetic import GeneticAlgorithm
+from .neural_network import ACTIVATIONS
+
+# Span of every network input over the game's geometry, in activate_population's order: distance to the
+# pipe, height difference to its gap, velocity, then the same distance and height for the next pipe
+INPUT_RANGES = ((0.0, 2.4), (-1.85, 1.75), (-1.0, 1.0), (1.0, 3.4), (-1.85, 1.75))
+
+# Largest decision table build_table makes, in cells; 64 bins for 3 inputs, 27 for 5
+MAX_TABLE_CELLS = 1 << 24
+
+class QuantizedNetwork:
+    """A network whose weights and biases are stored as int8 (one float scale per tensor) or float16"""
+    def __init__(self, layers, activations, tensors, scales):
+        self.layers = tuple(layers)
+        self.activations = tuple(activations)
+        self.tensors = tensors
+        self.scales = scales
+        # Dequantized once; inference runs in float32
+        self.params = [tensor.astype(np.float32) * np.float32(scale) for tensor, scale in zip(tensors, scales)]
+
+    def forward_batch(self, inputs):
+        """First output for every row of an (N, in) input matrix"""
+        x = inputs.astype(np.float32)
+        for layer, activation in enumerate(self.activations):
+            x = ACTIVATIONS[activation](x @ self.params[2 * layer] + self.params[2 * layer + 1])
+        return x[:, 0]
+
+    def decide(self, inputs):
+        return self.forward_batch(np.atleast_2d(inputs)) > 0.5
+
+    def nbytes(self):
+        return sum(tensor.nbytes for tensor in self.tensors) + 4 * len(self.scales)
+
+def quantize(network, dtype='int8'):
+    """Quantize every weight and bias tensor of a NeuralNetwork, symmetrically around zero for int8"""
+    tensors = []
+    scales = []
+    for weights, bias in zip(network.weights, network.biases):
+        for param in (weights, bias):
+            if dtype == 'int8':
+                scale = max(np.abs(param).max(), 1e-12) / 127
+                tensors.append(np.round(param / scale).astype(np.int8))
+                scales.append(scale)
+            else:
+                tensors.append(param.astype(np.float16))
+                scales.append(1.0)
+    return QuantizedNetwork(network.layers, network.activations, tensors, np.array(scales))
+
+class DecisionTable:
+    """Flap decisions precomputed on a regular grid over the inputs, looked up by one array index.
+
+    Inputs outside the grid are clamped to its edge cells.
+    """
+    def __init__(self, table, low, high):
+        self.table = table
+        self.low = low
+        self.high = high
+        self.bins = np.array(table.shape)
+        self.cell = (high - low) / self.bins
+        # Plain Python copies for decide_one, which skips NumPy's per-call overhead
+        self._axes = list(zip(low.tolist(), (1 / self.cell).tolist(), (self.bins - 1).tolist()))
+
+    def cells(self, inputs):
+        """Grid cell of every row of an (N, in) input matrix"""
+        cells = ((inputs - self.low) / self.cell).astype(np.intp)
+        return np.clip(cells, 0, self.bins - 1)
+
+    def decide(self, inputs):
+        cells = self.cells(np.atleast_2d(inputs))
+        return self.table[tuple(cells.T)]
+
+    def decide_one(self, inputs):
+        """Decision for a single state, as a bot makes them"""
+        cell = tuple(min(max(int((x - low) * scale), 0), last) for x, (low, scale, last) in zip(inputs, self._axes))
+        return self.table[cell]
+
+    def nbytes(self):
+        return self.table.nbytes
+
+def default_bins(n_inputs, max_cells=MAX_TABLE_CELLS):
+    """Bins per input, at most 64, that keep a table over n_inputs within max_cells"""
+    bins = min(64, int(round(max_cells ** (1 / n_inputs))))
+    while bins ** n_inputs > max_cells:
+        bins -= 1
+    return bins
+
+def build_table(network, bins=None, ranges=None, max_cells=MAX_TABLE_CELLS):
+    """Evaluate network at the centre of every grid cell, one slab of the first input at a time.
+
+    bins defaults to the most that fit max_cells; asking for more raises ValueError,
+    as the table grows as bins^inputs.
+    """
+    ranges = np.array(ranges or INPUT_RANGES[:network.input_size], dtype=np.float64)
+    low, high = ranges[:, 0], ranges[:, 1]
+    if bins is None:
+        bins = default_bins(len(ranges), max_cells)
+    if bins ** len(ranges) > max_cells:
+        raise ValueError(f"a table of {bins}^{len(ranges)} cells exceeds {max_cells}; "
+                         f"use at most {default_bins(len(ranges), max_cells)} bins")
+    centres = [lo + (np.arange(bins) + 0.5) * (hi - lo) / bins for lo, hi in ranges]
+
+    n = len(ranges)
+    table = np.empty((bins,) * n, dtype=bool)
+    rest = np.stack(np.meshgrid(*centres[1:], indexing='ij'), axis=-1).reshape(-1, n - 1)
+    slab = np.empty((len(rest), n))
+    slab[:, 1:] = rest
+    for i, x in enumerate(centres[0]):
+        slab[:, 0] = x
+        table[i] = (network.forward_batch(slab) > 0.5).reshape((bins,) * (n - 1))
+    return DecisionTable(table, low, high)
+
+def record_states(network, seeds, max_steps=5000):
+    """Inputs the network sees at every decision while flying the seeded courses on its own"""
+    ga = GeneticAlgorithm(population_size=0, layers=network.layers, activations=network.activations)
+    ga.load_genomes(network.genome[None].copy())
+    states = []
+    for seed in seeds:
+        engine = GameEngine(genetic_algorithm=ga, seed=seed)
+        engine.spawn_population()
+        while engine.steps < max_steps and engine.advance():
+            states.append(ga.population[0].last_inputs.copy())
+    return np.array(states).reshape(-1, network.input_size)
+
+def accuracy_report(network, policies, samples):
+    """Share of decisions matching the float64 network, and the largest output error where there is one.
+
+    policies maps a name to a quantized network or decision table; samples maps
+    a name to an (N, in) matrix of inputs to compare them on.
+    """
+    report = {}
+    for sample_name, inputs in samples.items():
+        reference = network.forward_batch(inputs)
+        for name, policy in policies.items():
+            entry = {'agreement': float(np.mean(policy.decide(inputs) == (reference > 0.5)))}
+            if hasattr(policy, 'forward_batch'):
+                entry['max_output_error'] = float(np.abs(policy.forward_batch(inputs) - reference).max())
+            report.setdefault(name, {})[sample_name] = entry
+    return report
+
+def export_arrays(int8, float16, table):
+    """Everything a bot needs to decide without the float64 network, as a dict of arrays for np.savez"""
+    arrays = {
+        'layers': np.array(int8.layers, dtype=np.int64),
+        'activations': np.array(int8.activations),
+        'int8_scales': int8.scales,
+        'table': np.packbits(table.table),
+        'table_shape': np.array(table.table.shape, dtype=np.int64),
+        'table_low': table.low,
+        'table_high': table.high
+    }
+    for i, (q, h) in enumerate(zip(int8.tensors, float16.tensors)):
+        arrays[f'int8_{i}'] = q
+        arrays[f'float16_{i}'] = h
+    return arrays
+
+def load_table(path):
+    """The DecisionTable stored in an exported policy file"""
+    with np.load(path) as data:
+        shape = tuple(int(n) for n in data['table_shape'])
+        table = np.unpackbits(data['table'], count=int(np.prod(shape))).astype(bool).reshape(shape)
+        return DecisionTable(table, data['table_low'], data['table_high'])
+
+def load_quantized(path, dtype='int8'):
+    """The int8 or float16 QuantizedNetwork stored in an exported policy file"""
+    with np.load(path) as data:
+        layers = tuple(int(n) for n in data['layers'])
+        n_tensors = 2 * (len(layers) - 1)
+        tensors = [data[f'{dtype}_{i}'] for i in range(n_tensors)]
+        scales = data['int8_scales'] if dtype == 'int8' else np.ones(n_tensors)
+        return QuantizedNetwork(layers, [str(a) for a in data['activations']], tensors, scales)
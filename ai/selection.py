@@ -0,0 +1,38 @@
+import numpy as np
+
+# Selection strategies return a (2, n_pairs) array of parent indices into the population,
+# drawn in one vectorized call from a fitness value per genome.
+
+def top_k(fitness, k):
+    """Indices of the k fittest genomes, fittest first, without sorting the whole population"""
+    k = min(k, len(fitness))
+    # The k-th best value is found by partitioning; ties with it go to the lower indices,
+    # exactly as with a stable sort of the whole population
+    kth = -np.partition(-fitness, k - 1)[k - 1]
+    above = np.flatnonzero(fitness > kth)
+    tied = np.flatnonzero(fitness == kth)[:k - len(above)]
+    top = np.concatenate([above, tied])
+    return top[np.lexsort((top, -fitness[top]))]
+
+def truncation_selection(fitness, n_pairs, top_units=4):
+    """Both parents drawn uniformly from the top_units fittest genomes"""
+    top = top_k(fitness, top_units)
+    return top[np.random.randint(len(top), size=(2, n_pairs))]
+
+def tournament_selection(fitness, n_pairs, size=3):
+    """Each parent is the fittest of size genomes drawn uniformly with replacement"""
+    entrants = np.random.randint(len(fitness), size=(2, n_pairs, size))
+    winner = np.argmax(fitness[entrants], axis=-1)
+    return np.take_along_axis(entrants, winner[..., None], axis=-1)[..., 0]
+
+def proportional_selection(fitness, n_pairs):
+    """Roulette wheel: parents drawn with probability proportional to fitness above the worst genome"""
+    weights = fitness - fitness.min()
+    total = weights.sum()
+    if total <= 0:
+        return np.random.randint(len(fitness), size=(2, n_pairs))
+    cumulative = np.cumsum(weights / total)
+    parents = np.searchsorted(cumulative, np.random.rand(2, n_pairs), side='right')
+    return np.minimum(parents, len(fitness) - 1)
+
+SELECTION_STRATEGIES = ('truncation', 'tournament', 'proportional')
@@ -0,0 +1,253 @@
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+from game.engine import GameEngine
+from game.population import BirdPopulation
+from ai.genetic import GeneticAlgorithm
+from ai.evolution_strategies import EvolutionStrategies
+from ai.parallel import ParallelEvaluator
+from ai.neural_network import batch_forward
+
+def timed(fn, min_time):
+    """Call fn repeatedly for at least min_time seconds; returns (calls, elapsed)"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls, elapsed
+
+def bench_physics(population_size, min_time):
+    """Bird-steps/sec of BirdPopulation.step with every bird alive and pipes in view"""
+    population = BirdPopulation(population_size)
+    for i in range(population_size):
+        population.add(300, i)
+    # The first pipe overlaps the birds so collisions are tested, but its gap spans the whole screen
+    pipe_x = np.array([160, 460, 760])
+    pipe_gap_y = np.array([[0, 0, 0]])
+    steps = 0
+    elapsed = 0
+    while elapsed < min_time:
+        # Birds fall from mid-screen for 30 steps without leaving it, then are reset outside the timer
+        population.y[:] = 300
+        population.velocity[:] = 0
+        population.alive[:] = True
+        population.rebuild_active()
+        start = time.perf_counter()
+        for _ in range(30):
+            population.step(pipe_x, pipe_gap_y, 70, 600, 600)
+        elapsed += time.perf_counter() - start
+        steps += 30
+    return {'bird_steps_per_sec': population_size * steps / elapsed}
+
+def bench_inference(population_size, hidden_size, min_time):
+    """Inferences/sec of one batched forward pass over the whole population"""
+    ga = GeneticAlgorithm(population_size, hidden_size=hidden_size)
+    params = ga.stack_population()
+    inputs = np.random.randn(population_size, 3)
+    calls, elapsed = timed(lambda: batch_forward(params, inputs), min_time)
+    return {'inferences_per_sec': population_size * calls / elapsed}
+
+def bench_evolve(population_size, hidden_size, min_time):
+    """Seconds per evolve_population call on random fitness"""
+    ga = GeneticAlgorithm(population_size, hidden_size=hidden_size)
+    fitness = np.random.rand(population_size)
+    calls, elapsed = timed(lambda: ga.evolve_population(fitness), min_time)
+    return {'evolve_sec_per_generation': elapsed / calls}
+
+def bench_generations(population_size, hidden_size, max_steps, min_time):
+    """Full headless generations (simulate, then evolve) per second"""
+    ga = GeneticAlgorithm(population_size, hidden_size=hidden_size)
+    engine = GameEngine(genetic_algorithm=ga, seed=0)
+
+    def generation():
+        engine.spawn_population()
+        engine.run(max_steps)
+        ga.evolve_population(engine.genome_stats()[0])
+
+    calls, elapsed = timed(generation, min_time)
+    return {'generations_per_sec': calls / elapsed}
+
+def bench_memory(population_size, hidden_size, dtype, memmap):
+    """Peak and retained heap bytes per individual over spawning, a few steps and one evolve, plus genome file bytes with memmap"""
+    with tempfile.TemporaryDirectory() as tmp:
+        genome_file = os.path.join(tmp, 'genomes.dat') if memmap else None
+        tracemalloc.start()
+        ga = GeneticAlgorithm(population_size, hidden_size=hidden_size, dtype=dtype, genome_file=genome_file)
+        engine = GameEngine(genetic_algorithm=ga, seed=0)
+        engine.spawn_population()
+        engine.run(10)
+        ga.evolve_population(engine.genome_stats()[0])
+        heap, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        metrics = {
+            'peak_bytes_per_individual': peak / population_size,
+            'bytes_per_individual': heap / population_size
+        }
+        if memmap:
+            metrics['file_bytes_per_individual'] = os.path.getsize(genome_file) / population_size
+        del ga, engine
+    return metrics
+
+def bench_solve(optimizer, population_size, hidden_size, seeds, target_steps, max_generations):
+    """Updates until some bird survives target_steps, averaged over seeds; unsolved runs count max_generations.
+
+    Birds of the random first population are not counted, so an optimizer that starts from a wider
+    spread than the other is not credited with solving before it has learned anything.
+    """
+    runs = []
+    for seed in seeds:
+        np.random.seed(seed)
+        if optimizer == 'es':
+            ga = EvolutionStrategies(population_size, hidden_size=hidden_size)
+        else:
+            ga = GeneticAlgorithm(population_size, hidden_size=hidden_size)
+        engine = GameEngine(genetic_algorithm=ga, seed=seed)
+        solved = None
+        for generation in range(max_generations + 1):
+            engine.spawn_population()
+            engine.run(target_steps)
+            fitness, _, survival_steps = engine.genome_stats()
+            if generation and survival_steps.max() >= target_steps:
+                solved = generation
+                break
+            ga.evolve_population(fitness)
+        runs.append(solved)
+    generations = [max_generations if solved is None else solved for solved in runs]
+    return {'generations_to_solve': float(np.mean(generations))}, runs
+
+def bench_workers(population_size, hidden_size, max_steps, workers, min_time):
+    """Full generations per second with evaluation spread over a ParallelEvaluator's worker processes"""
+    ga = GeneticAlgorithm(population_size, hidden_size=hidden_size)
+    with ParallelEvaluator(ga, workers, seed=0, max_steps=max_steps) as evaluator:
+        # The first generation also starts the worker processes
+        ga.evolve_population(evaluator.evaluate()[0])
+        calls, elapsed = timed(lambda: ga.evolve_population(evaluator.evaluate()[0]), min_time)
+    return {'generations_per_sec': calls / elapsed}
+
+def compare(results, baseline_path, threshold):
+    """Print the relative change of every metric against a previous results file"""
+    with open(baseline_path) as f:
+        baseline = {
+            (r['benchmark'], r['population'], r.get('hidden_size')): r
+            for r in json.load(f)['results']
+        }
+
+    regressions = 0
+    for result in results:
+        key = (result['benchmark'], result['population'], result.get('hidden_size'))
+        old = baseline.get(key)
+        if old is None:
+            continue
+        for metric, value in result['metrics'].items():
+            # A zero baseline has no relative change
+            if not old['metrics'].get(metric):
+                continue
+            change = value / old['metrics'][metric] - 1
+            # Time and generations to solve are the metrics where lower is better
+            worse = -change if metric.endswith('_per_sec') else change
+            flag = "  REGRESSION" if worse > threshold else ""
+            regressions += bool(flag)
+            print(f"{key[0]:<12} P={key[1]:<7} H={key[2]}  {metric}: {change:+.1%}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark headless simulation, inference and evolution throughput")
+    parser.add_argument('--populations', type=int, nargs='+', default=[50, 500, 5000, 50000, 100000])
+    parser.add_argument('--hidden-sizes', type=int, nargs='+', default=[6, 16, 64])
+    parser.add_argument('--max-steps', type=int, default=300, help="step cap for full-generation runs")
+    parser.add_argument('--min-time', type=float, default=0.5, help="seconds spent on each measurement")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, nargs='+', default=[],
+                        help="also measure generations/sec evaluated on this many worker processes")
+    parser.add_argument('--memory', action='store_true', help="also measure memory per individual")
+    parser.add_argument('--memory-populations', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--solve', action='store_true', help="also compare generations-to-solve of the GA and ES")
+    parser.add_argument('--solve-seeds', type=int, nargs='+', default=[0, 1, 2, 3, 4])
+    parser.add_argument('--solve-population', type=int, default=50)
+    parser.add_argument('--solve-steps', type=int, default=2000, help="survival steps that count as solved")
+    parser.add_argument('--solve-generations', type=int, default=100, help="generations before a run counts as unsolved")
+    parser.add_argument('--output', default='benchmark.json')
+    parser.add_argument('--baseline', metavar='PATH', help="earlier results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.1, help="relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    results = []
+
+    def record(benchmark, population_size, hidden_size, metrics, **extra):
+        results.append({
+            'benchmark': benchmark,
+            'population': population_size,
+            'hidden_size': hidden_size,
+            'metrics': metrics,
+            **extra
+        })
+        values = ", ".join(f"{k}={v:.4g}" for k, v in metrics.items())
+        print(f"{benchmark:<12} P={population_size:<7} H={hidden_size}  {values}")
+
+    for population_size in args.populations:
+        np.random.seed(args.seed)
+        record('physics', population_size, None, bench_physics(population_size, args.min_time))
+        for hidden_size in args.hidden_sizes:
+            np.random.seed(args.seed)
+            record('inference', population_size, hidden_size,
+                   bench_inference(population_size, hidden_size, args.min_time))
+            np.random.seed(args.seed)
+            record('evolve', population_size, hidden_size,
+                   bench_evolve(population_size, hidden_size, args.min_time))
+        np.random.seed(args.seed)
+        record('generation', population_size, args.hidden_sizes[0],
+               bench_generations(population_size, args.hidden_sizes[0], args.max_steps, args.min_time))
+
+    for population_size in args.populations:
+        for workers in args.workers:
+            np.random.seed(args.seed)
+            record(f'workers-{workers}', population_size, args.hidden_sizes[0],
+                   bench_workers(population_size, args.hidden_sizes[0], args.max_steps, workers, args.min_time))
+
+    if args.memory:
+        for population_size in args.memory_populations:
+            for name, dtype, memmap in (('float64', np.float64, False), ('float32', np.float32, False),
+                                        ('memmap', np.float32, True)):
+                np.random.seed(args.seed)
+                record(f'memory-{name}', population_size, args.hidden_sizes[0],
+                       bench_memory(population_size, args.hidden_sizes[0], dtype, memmap))
+
+    if args.solve:
+        for optimizer in ('ga', 'es'):
+            metrics, runs = bench_solve(
+                optimizer, args.solve_population, args.hidden_sizes[0], args.solve_seeds, args.solve_steps,
+                args.solve_generations
+            )
+            record(f'solve-{optimizer}', args.solve_population, args.hidden_sizes[0], metrics, runs=runs)
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'seed': args.seed,
+            'max_steps': args.max_steps
+        },
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.threshold)
+        if regressions:
+            raise SystemExit(f"{regressions} metrics regressed by more than {args.threshold:.0%}")
+
+if __name__ == "__main__":
+    main()
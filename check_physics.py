@@ -0,0 +1,157 @@
+import argparse
+import sys
+import numpy as np
+import pygame
+from game.population import BirdPopulation
+
+# Geometry of the game as the engine sets it up
+X = 150
+PIPE_WIDTH = 70
+GAP_HEIGHT = 160
+PIPE_DISTANCE = 300
+PIPE_SPEED = 2
+
+class ReferenceBird:
+    """One bird stepped the way the original per-bird game loop did it"""
+    def __init__(self, y, course):
+        self.x = X
+        self.y = y
+        self.course = course
+        self.velocity = 0
+        self.gravity = 0.4
+        self.flap_strength = -7
+        self.max_velocity = 8
+        self.width = 34
+        self.height = 24
+        self.alive = True
+        self.score = 0
+        self.distance = 0
+        self.last_pipe_x = float('inf')
+
+    def flap(self):
+        if self.alive:
+            self.velocity = self.flap_strength
+
+    def update(self):
+        self.velocity += self.gravity
+        self.velocity = min(max(self.velocity, -self.max_velocity), self.max_velocity)
+        self.y += self.velocity
+        self.distance += 1
+
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+class ReferencePipe:
+    def __init__(self, x, game_height, gap_ys):
+        self.x = x
+        self.game_height = game_height
+        self.gap_ys = gap_ys
+
+    def get_rects(self, course):
+        gap_y = int(self.gap_ys[course])
+        return [
+            pygame.Rect(self.x, 0, PIPE_WIDTH, gap_y),
+            pygame.Rect(self.x, gap_y + GAP_HEIGHT, PIPE_WIDTH, self.game_height - (gap_y + GAP_HEIGHT))
+        ]
+
+def reference_step(birds, pipes, game_height):
+    """The original loop: move, bounds, then every pipe's rects and scoring while the bird lives"""
+    for bird in birds:
+        if not bird.alive:
+            continue
+        bird.update()
+        if bird.y < 0 or bird.y > game_height - bird.height:
+            bird.alive = False
+        for pipe in pipes:
+            if bird.alive:
+                for rect in pipe.get_rects(bird.course):
+                    if bird.get_rect().colliderect(rect):
+                        bird.alive = False
+                if (pipe.x + PIPE_WIDTH < bird.x and
+                        pipe.x + PIPE_WIDTH > bird.x - bird.velocity and
+                        pipe.x < bird.last_pipe_x):
+                    bird.score += 1
+                    bird.last_pipe_x = pipe.x
+
+def compare(seed, n_birds, n_courses, steps, game_height, noise):
+    """Step both implementations on the same course and flaps; returns the first mismatching step, or None.
+
+    Every bird steers for the centre of the next gap with its own aim, off by noise pixels on average,
+    so that some pass many pipes and score while others crash into every kind of edge.
+    """
+    rng = np.random.default_rng(seed)
+
+    def new_gap_ys():
+        return rng.integers(150, game_height - 150 - GAP_HEIGHT, n_courses, endpoint=True)
+
+    courses = np.arange(n_birds) % n_courses
+    start_y = rng.uniform(100, game_height - 100, n_birds)
+    aim = rng.normal(0, noise, n_birds)
+    birds = [ReferenceBird(y, course) for y, course in zip(start_y.tolist(), courses.tolist())]
+    population = BirdPopulation(x=X)
+    for i in range(n_birds):
+        population.add(start_y[i], i, courses[i])
+    pipes = [ReferencePipe(800 + i * PIPE_DISTANCE, game_height, new_gap_ys()) for i in range(3)]
+
+    for step in range(steps):
+        upcoming = next(pipe for pipe in pipes if pipe.x + PIPE_WIDTH > X)
+        target = upcoming.gap_ys[courses] + GAP_HEIGHT / 2 + aim + rng.normal(0, 5, n_birds)
+        flaps = population.y[:n_birds] + population.height / 2 > target
+        for bird, flap in zip(birds, flaps.tolist()):
+            if flap:
+                bird.flap()
+        population.flap(flaps)
+
+        reference_step(birds, pipes, game_height)
+        pipe_x = np.array([pipe.x for pipe in pipes], dtype=float)
+        gap_ys = np.stack([pipe.gap_ys for pipe in pipes], axis=1)
+        died = population.step(pipe_x, gap_ys, PIPE_WIDTH, GAP_HEIGHT, game_height)
+
+        for pipe in pipes:
+            pipe.x -= PIPE_SPEED
+        if pipes[0].x < -PIPE_WIDTH:
+            pipes.pop(0)
+            pipes.append(ReferencePipe(pipes[-1].x + PIPE_DISTANCE, game_height, new_gap_ys()))
+
+        alive = np.array([bird.alive for bird in birds])
+        expected = {
+            'alive': alive,
+            'y': np.array([bird.y for bird in birds]),
+            'velocity': np.array([bird.velocity for bird in birds], dtype=float),
+            'score': np.array([bird.score for bird in birds]),
+            'distance': np.array([bird.distance for bird in birds]),
+            'last_pipe_x': np.array([bird.last_pipe_x for bird in birds], dtype=float)
+        }
+        for name, values in expected.items():
+            if not np.array_equal(getattr(population, name)[:n_birds], values):
+                return step, name
+        if not np.array_equal(population.active, np.flatnonzero(alive)) or not np.isin(died, np.flatnonzero(~alive)).all():
+            return step, 'active'
+        if not alive.any():
+            break
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check that BirdPopulation.step matches the original per-bird physics and collisions exactly"
+    )
+    parser.add_argument('--seeds', type=int, nargs='+', default=[0, 1, 2, 3, 4])
+    parser.add_argument('--birds', type=int, default=300)
+    parser.add_argument('--courses', type=int, default=2, help="pipe courses the birds are spread over")
+    parser.add_argument('--steps', type=int, default=3000)
+    parser.add_argument('--game-height', type=int, default=900)
+    parser.add_argument('--noise', type=float, default=60, help="pixels the birds' aim at each gap is off by")
+    args = parser.parse_args()
+
+    failures = 0
+    for seed in args.seeds:
+        mismatch = compare(seed, args.birds, args.courses, args.steps, args.game_height, args.noise)
+        if mismatch:
+            failures += 1
+            print(f"seed {seed}: {mismatch[1]} differs after step {mismatch[0]}")
+        else:
+            print(f"seed {seed}: identical")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
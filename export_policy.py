@@ -0,0 +1,75 @@
+import argparse
+import time
+import numpy as np
+from ai.checkpoint import load_checkpoint, write_checkpoint
+from ai.quantize import (
+    INPUT_RANGES, MAX_TABLE_CELLS, accuracy_report, build_table, export_arrays, quantize, record_states
+)
+
+def decisions_per_sec(decide, inputs, min_time=0.2):
+    """Single-state decisions per second, one call per state as a bot would make them"""
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        for row in inputs:
+            decide(row)
+        calls += len(inputs)
+    return calls / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile a checkpoint's best network into quantized weights and a decision lookup table"
+    )
+    parser.add_argument('checkpoint', help="checkpoint written by main.py or train.py")
+    parser.add_argument('--output', default='policy.npz')
+    parser.add_argument('--bins', type=int, default=None,
+                        help="grid cells per input of the lookup table; the table holds bins^inputs decisions "
+                             "(default: the most within --max-cells, at most 64)")
+    parser.add_argument('--max-cells', type=int, default=MAX_TABLE_CELLS, help="largest lookup table to build")
+    parser.add_argument('--seeds', type=int, nargs='+', default=[0, 1, 2, 3, 4],
+                        help="courses flown to collect the states accuracy is measured on")
+    parser.add_argument('--max-steps', type=int, default=5000, help="steps flown per course")
+    parser.add_argument('--samples', type=int, default=100000, help="uniformly random inputs accuracy is measured on")
+    args = parser.parse_args()
+
+    network = load_checkpoint(args.checkpoint).best_network
+    if network is None:
+        parser.error(f"{args.checkpoint} has no best network yet")
+
+    int8 = quantize(network, 'int8')
+    float16 = quantize(network, 'float16')
+    try:
+        table = build_table(network, args.bins, max_cells=args.max_cells)
+    except ValueError as error:
+        parser.error(str(error))
+    write_checkpoint(args.output, export_arrays(int8, float16, table))
+    print(f"Wrote {args.output}: float64 {network.genome.nbytes} B, int8 {int8.nbytes()} B, "
+          f"float16 {float16.nbytes()} B, table {table.nbytes() // 8} B packed ({table.table.shape[0]}^{network.input_size} cells)")
+
+    ranges = np.array(INPUT_RANGES[:network.input_size])
+    rng = np.random.default_rng(0)
+    samples = {
+        'flown': record_states(network, args.seeds, args.max_steps),
+        'uniform': rng.uniform(ranges[:, 0], ranges[:, 1], (args.samples, network.input_size))
+    }
+    policies = {'int8': int8, 'float16': float16, 'table': table}
+    report = accuracy_report(network, policies, samples)
+
+    print(f"Decision agreement with float64 on {len(samples['flown'])} flown and {args.samples} uniform states")
+    for name, entries in report.items():
+        columns = []
+        for sample_name, entry in entries.items():
+            column = f"{sample_name} {entry['agreement']:.4%}"
+            if 'max_output_error' in entry:
+                column += f" (max output error {entry['max_output_error']:.2e})"
+            columns.append(column)
+        print(f"  {name:<8} " + ", ".join(columns))
+
+    inputs = samples['uniform'][:1000]
+    print("Single-state decisions per second")
+    print(f"  float64  {decisions_per_sec(lambda row: network.forward(row) > 0.5, inputs):,.0f}")
+    print(f"  int8     {decisions_per_sec(int8.decide, inputs):,.0f}")
+    print(f"  table    {decisions_per_sec(table.decide_one, inputs.tolist()):,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import pygame
+import os
+from functools import lru_cache
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
+
+@lru_cache(maxsize=None)
+def load_image(name, size=None, alpha=True):
+    """Load (and optionally scale) an image from assets/ once per process"""
+    image = pygame.image.load(os.path.join(ASSETS_DIR, name))
+    image = image.convert_alpha() if alpha else image.convert()
+    if size:
+        image = pygame.transform.scale(image, size)
+    return image
+
+@lru_cache(maxsize=256)
+def pipe_surfaces(gap_y, width, game_height, gap_height):
+    """Pre-scaled top and flipped bottom pipe surfaces for one gap position"""
+    image = load_image("pipe.png", (width, game_height))
+    top_pipe = pygame.transform.scale(image, (width, gap_y))
+
+    bottom_height = game_height - (gap_y + gap_height)
+    bottom_pipe = pygame.transform.scale(image, (width, bottom_height))
+    bottom_pipe = pygame.transform.flip(bottom_pipe, False, True)
+    return top_pipe, bottom_pipe
@@ -1,60 +1,81 @@
-import pygame
-import numpy as np
-import os
-
 class Bird:
-    def __init__(self, x, y, index):
-        self.x = x
-        self.y = y
-        self.index = index
-        
-        # Physics
-        self.velocity = 0
-        self.gravity = 0.4  
-        self.flap_strength = -7  
-        self.max_velocity = 8  
-        
-        # Dimensions
-        self.width = 34
-        self.height = 24
-        
-        # Game stats
-        self.alive = True
-        self.fitness = 0
-        self.score = 0
-        self.distance = 0
-        self.last_pipe_x = float('inf')
-        
-        # Previous gen stats
-        self.fitness_prev = 0
-        self.score_prev = 0
-        
-        current_dir = os.path.dirname(os.path.dirname(__file__))
-        self.image = pygame.image.load(os.path.join(current_dir, "assets", "flappy-bird.png")).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.width, self.height))
-        
+    """View onto one slot of a BirdPopulation; all state, including the bird's network index, lives in its arrays"""
+    __slots__ = ('population', 'slot')
+
+    def __init__(self, population, slot):
+        self.population = population
+        self.slot = slot
+
+    @property
+    def index(self):
+        return int(self.population.index[self.slot])
+
+    @property
+    def x(self):
+        return self.population.x
+
+    @property
+    def width(self):
+        return self.population.width
+
+    @property
+    def height(self):
+        return self.population.height
+
+    @property
+    def y(self):
+        return self.population.y[self.slot]
+
+    @y.setter
+    def y(self, value):
+        self.population.y[self.slot] = value
+
+    @property
+    def velocity(self):
+        return self.population.velocity[self.slot]
+
+    @velocity.setter
+    def velocity(self, value):
+        self.population.velocity[self.slot] = value
+
+    @property
+    def fitness(self):
+        return self.population.fitness[self.slot]
+
+    @fitness.setter
+    def fitness(self, value):
+        self.population.fitness[self.slot] = value
+
+    @property
+    def alive(self):
+        return bool(self.population.alive[self.slot])
+
+    @property
+    def score(self):
+        return int(self.population.score[self.slot])
+
+    @property
+    def distance(self):
+        return int(self.population.distance[self.slot])
+
+    @property
+    def last_pipe_x(self):
+        return self.population.last_pipe_x[self.slot]
+
     def flap(self):
         if self.alive:
-            self.velocity = self.flap_strength
-    
-    def update(self):
-        if not self.alive:
-            return
-            
-        self.velocity += self.gravity
-        self.velocity = min(max(self.velocity, -self.max_velocity), self.max_velocity)
-        self.y += self.velocity
-        
-        self.distance += 1
-        
-    def draw(self, screen):
-        if not self.alive:
-            return
-            
-        screen.blit(self.image, (self.x, self.y))
-    
-    def die(self):
-        self.alive = False
-        
-    def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height) 
\ No newline at end of file
+            self.velocity = self.population.flap_strength
+
+class BirdViews:
+    """Sequence of Bird views over the occupied slots of a BirdPopulation, created on access"""
+    def __init__(self, population):
+        self.population = population
+
+    def __len__(self):
+        return self.population.size
+
+    def __getitem__(self, slot):
+        return Bird(self.population, range(self.population.size)[slot])
+
+    def __iter__(self):
+        return (Bird(self.population, slot) for slot in range(self.population.size))
@@ -0,0 +1,65 @@
+import numpy as np
+import pygame
+from .assets import load_image
+
+# Density colour ramp from few to many birds per row
+DENSITY_STOPS = np.array([0.0, 0.5, 1.0])
+DENSITY_COLORS = np.array([[40, 60, 200], [250, 200, 40], [230, 40, 30]])
+
+class BirdRenderer:
+    """Draw the live birds of a BirdPopulation with a cost that stays bounded as the population grows.
+
+    Up to density_threshold birds are drawn as one shared sprite through a
+    single Surface.blits call. Above it the birds become a heat strip of how
+    many of them fly at each height, with the highlight fittest birds still
+    drawn as sprites on top.
+    """
+    def __init__(self, game_height, density_threshold=2000, highlight=0, row_height=4):
+        self.game_height = game_height
+        self.density_threshold = density_threshold
+        self.highlight = highlight
+        self.row_height = row_height
+        self.n_rows = -(-game_height // row_height)
+        self.sprite = None
+        self.outline = (255, 255, 255)
+
+    def draw(self, screen, population, slots, scores=None):
+        """Draw the birds in slots; scores, one per slot, picks the birds to highlight in the density view"""
+        if self.sprite is None:
+            self.sprite = load_image("flappy-bird.png", (population.width, population.height))
+
+        if not self.dense(len(slots)):
+            self.draw_sprites(screen, population.x, population.y[slots])
+            return
+
+        self.draw_density(screen, population, slots)
+        if self.highlight and scores is not None:
+            top = slots
+            if len(slots) > self.highlight:
+                top = slots[np.argpartition(scores, -self.highlight)[-self.highlight:]]
+            self.draw_sprites(screen, population.x, population.y[top])
+            for y in population.y[top].tolist():
+                pygame.draw.rect(screen, self.outline, (population.x, y, population.width, population.height), 1)
+
+    def dense(self, n_birds):
+        """Whether n_birds are drawn as the density view"""
+        return n_birds > self.density_threshold
+
+    def draw_sprites(self, screen, x, ys):
+        sprite = self.sprite
+        screen.blits([(sprite, (x, y)) for y in ys.tolist()], False)
+
+    def draw_density(self, screen, population, slots):
+        """Colour each row_height band of the birds' column by how many birds are in it, on a log scale"""
+        rows = np.clip(population.y[slots] + population.height / 2, 0, self.game_height - 1).astype(np.intp)
+        counts = np.bincount(rows // self.row_height, minlength=self.n_rows)
+        level = np.log1p(counts) / np.log1p(counts.max())
+
+        colors = np.stack([np.interp(level, DENSITY_STOPS, channel) for channel in DENSITY_COLORS.T], axis=-1)
+        # Empty rows stay black, which the colour key makes transparent
+        colors[counts == 0] = 0
+
+        strip = pygame.surfarray.make_surface(colors.astype(np.uint8)[None])
+        strip = pygame.transform.scale(strip, (population.width, self.n_rows * self.row_height))
+        strip.set_colorkey((0, 0, 0))
+        screen.blit(strip, (population.x, 0))
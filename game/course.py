@@ -0,0 +1,30 @@
+import numpy as np
+
+class Course:
+    """Seeded pipe gap positions for one or more courses, generated in blocks as pipes are needed.
+
+    All courses share the pipes' x positions; only the gap heights differ.
+    Block b of course k comes from its own generator seeded with (seed, k, b),
+    so a course is identical however far it has been generated.
+    """
+    def __init__(self, seed, n_courses=1, game_height=600, gap_height=160, block=64):
+        self.seed = seed
+        self.n_courses = n_courses
+        self.min_gap_y = 150
+        self.max_gap_y = game_height - 150 - gap_height
+        self.block = block
+        self.gap_y = np.empty((n_courses, 0), dtype=np.int16)
+
+    def gaps(self, i):
+        """Gap y of pipe i on every course"""
+        while i >= self.gap_y.shape[1]:
+            self._extend()
+        return self.gap_y[:, i]
+
+    def _extend(self):
+        b = self.gap_y.shape[1] // self.block
+        blocks = [
+            np.random.default_rng([self.seed, k, b]).integers(self.min_gap_y, self.max_gap_y + 1, self.block)
+            for k in range(self.n_courses)
+        ]
+        self.gap_y = np.concatenate([self.gap_y, np.array(blocks, dtype=np.int16)], axis=1)
@@ -0,0 +1,220 @@
+import random
+import time
+import numpy as np
+from .bird import Bird, BirdViews
+from .pipe import Pipe
+from .course import Course
+from .population import BirdPopulation
+from .profiler import Profiler
+from .metrics import TrainingMetrics
+from .fitness import gap_fitness
+
+class GameEngine:
+    """Game state and physics without any display, shared by the window and headless training"""
+    def __init__(self, width=800, height=900, genetic_algorithm=None, seed=None, profiler=None, metrics=None,
+                 decision_interval=1, fitness=None, courses=1, fixed_course=False, cache=None):
+        self.width = width
+        self.height = height
+        self.game_height = 600
+
+        self.ga = genetic_algorithm
+        self.running = True
+
+        self.population = BirdPopulation()
+        self.birds = BirdViews(self.population)
+        self.pipes = []
+        self.pipe_distance = 300
+
+        # With a seed every generation gets its own reproducible course(s), or the same ones
+        # with fixed_course; every genome flies each of the n_courses courses and its fitness
+        # is averaged over them
+        self.seed = seed
+        self.fixed_course = fixed_course
+        self.n_courses = courses
+        self.course = None
+        self.next_pipe = 0
+
+        self.stats = {
+            'generation': 0,
+            'best_fitness': 0,
+            'alive_birds': 0,
+            'total_birds': 0,
+            'speed': 1
+        }
+
+        self.game_speed = 1
+        # Networks are queried every decision_interval physics steps, independent of game_speed
+        self.decision_interval = decision_interval
+        self.steps = 0
+        # Called once per bird, vectorized over the birds that died on the same step
+        self.fitness = fitness or gap_fitness
+        # Optional FitnessCache: genomes it already holds for this course are not simulated again
+        self.cache = cache
+        self.cached = {}
+        self.pending = []
+        self.profiler = profiler or Profiler()
+        self.metrics = metrics or TrainingMetrics()
+        self.generation_start = time.perf_counter()
+
+        self.reset()
+
+    def reset(self):
+        self.population.clear()
+        self.pipes.clear()
+        self.steps = 0
+
+        self.course = Course(self.course_seed(), self.n_courses, self.game_height)
+        self.next_pipe = 0
+        for i in range(3):
+            self.add_pipe(800 + i * self.pipe_distance)
+
+    def course_seed(self):
+        if self.seed is None:
+            return random.randrange(2**32)
+        if self.fixed_course or not self.ga:
+            return self.seed
+        return self.seed + self.ga.generation
+
+    def add_pipe(self, x):
+        self.pipes.append(Pipe(x, self.game_height, self.course.gaps(self.next_pipe)))
+        self.next_pipe += 1
+
+    def add_bird(self, index, course=0):
+        slot = self.population.add(self.height//2, index, course)
+        return Bird(self.population, slot)
+
+    def spawn_population(self):
+        """Reset the course and add one bird per network and course, skipping networks found in the cache"""
+        self.reset()
+        self.generation_start = time.perf_counter()
+
+        networks = range(self.ga.population_size)
+        self.cached.clear()
+        self.pending = []
+        if self.cache is not None:
+            for i in networks:
+                key = self.cache.key(self.ga.genomes[i], self.course.seed)
+                result = self.cache.get(key)
+                if result is None:
+                    self.pending.append((i, key))
+                else:
+                    self.cached[i] = result
+            networks = [i for i, _ in self.pending]
+
+        networks = np.asarray(networks, dtype=np.int64)
+        for course in range(self.n_courses):
+            self.population.add_many(self.height // 2, networks, course)
+
+    def physics_step(self):
+        """Move birds and pipes by one physics step"""
+        population = self.population
+        with self.profiler.phase('physics'):
+            live = population.move(self.game_height)
+        with self.profiler.phase('collision'):
+            pipe_x = np.array([pipe.x for pipe in self.pipes])
+            pipe_gap_y = np.stack([pipe.gap_ys for pipe in self.pipes], axis=1)
+            died = population.collide(
+                live, pipe_x, pipe_gap_y,
+                self.pipes[0].width, self.pipes[0].gap_height, self.game_height
+            )
+
+        for pipe in self.pipes:
+            pipe.update()
+
+        if self.pipes[0].x < -self.pipes[0].width:
+            self.pipes.pop(0)
+            self.add_pipe(self.pipes[-1].x + self.pipe_distance)
+        self.steps += 1
+
+        if len(died):
+            self.score_birds(died)
+
+    def score_birds(self, slots):
+        """Store the final fitness of the birds in the given population slots"""
+        with self.profiler.phase('fitness'):
+            self.population.fitness[slots] = self.fitness(self.population, slots, self.get_closest_pipe())
+
+    def advance(self):
+        """One physics step, followed by a decision when one is due; returns False once all birds are dead"""
+        self.physics_step()
+        if self.steps % self.decision_interval == 0:
+            return self.think(self.get_closest_pipe())
+        return self.population.n_active > 0
+
+    def update(self):
+        """Advance game_speed physics steps, stopping early once all birds are dead; returns whether any bird is alive"""
+        for _ in range(self.game_speed):
+            if not self.advance():
+                return False
+        return True
+
+    def get_closest_pipe(self):
+        closest_pipe = None
+        min_distance = float('inf')
+        for pipe in self.pipes:
+            if pipe.x + pipe.width > 150:
+                if pipe.x < min_distance:
+                    min_distance = pipe.x
+                    closest_pipe = pipe
+        return closest_pipe
+
+    def get_next_pipe(self, pipe):
+        """The pipe after the given one, for networks that look two pipes ahead"""
+        if pipe is None:
+            return None
+        position = self.pipes.index(pipe) + 1
+        return self.pipes[position] if position < len(self.pipes) else None
+
+    def think(self, closest_pipe):
+        """Let every live bird's network decide in one batch; returns False once all birds are dead"""
+        if self.population.n_active == 0:
+            return False
+        with self.profiler.phase('inference'):
+            self.ga.activate_population(self.population, closest_pipe, self.get_next_pipe(closest_pipe))
+        return True
+
+    def step(self):
+        """Advance one frame, rolling over to the next generation once every bird is dead"""
+        if not self.update():
+            self.next_generation()
+        return self.get_closest_pipe()
+
+    def run(self, max_steps):
+        """Step until every bird is dead or max_steps is reached; returns the number of steps taken"""
+        while self.steps < max_steps:
+            if not self.advance():
+                break
+        return self.steps
+
+    def genome_stats(self):
+        """Fitness, score and survival steps of every network, averaged over its birds on each course"""
+        population = self.population
+        n = population.size
+        # Birds still flying when the generation is cut off are scored as they are now
+        if population.n_active:
+            self.score_birds(population.active.copy())
+        index = population.index[:n]
+        size = self.ga.population_size
+        fitness = np.bincount(index, population.fitness[:n], size) / self.n_courses
+        score = np.bincount(index, population.score[:n], size) / self.n_courses
+        distance = np.bincount(index, population.distance[:n], size) / self.n_courses
+
+        for i, result in self.cached.items():
+            fitness[i], score[i], distance[i] = result
+        if self.cache is not None:
+            for i, key in self.pending:
+                self.cache.put(key, (fitness[i], score[i], distance[i]))
+            self.pending = []
+        return fitness, score, distance
+
+    def next_generation(self):
+        """Evolve the population from the current birds and start a fresh run"""
+        fitness, score, distance = self.genome_stats()
+        with self.profiler.phase('evolve'):
+            self.ga.evolve_population(fitness)
+        self.metrics.record_generation(
+            self.ga.generation - 1, fitness, score, distance,
+            time.perf_counter() - self.generation_start, self.ga.best_fitness
+        )
+        self.profiler.end_generation(self.ga.generation - 1)
+        self.spawn_population()
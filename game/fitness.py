@@ -0,0 +1,23 @@
+import numpy as np
+
+# Fitness functions score a batch of birds, given by their population slots, against the closest pipe.
+# The engine calls them once per bird: on the step it dies, or at the end of the generation if it survived.
+
+def gap_fitness(population, slots, pipe):
+    """Pipes passed, distance flown, closeness to the gap centre and a bonus while the pipe is still ahead"""
+    fitness = population.score[slots] * 1000 + population.distance[slots] / 100
+    if pipe is not None:
+        dx = pipe.x + pipe.width - population.x
+        pipe_center = pipe.gap_ys[population.course[slots]] + pipe.gap_height/2
+        dy = population.y[slots] - pipe_center
+        fitness = fitness - (np.abs(dy) / pipe_center) * 100 + (50 if dx > 0 else 0)
+    return fitness
+
+def distance_fitness(population, slots, pipe):
+    """Pipes passed and distance flown only"""
+    return population.score[slots] * 1000 + population.distance[slots].astype(float)
+
+FITNESS_FUNCTIONS = {
+    'gap': gap_fitness,
+    'distance': distance_fitness
+}
@@ -0,0 +1,35 @@
+from collections import OrderedDict
+
+class FitnessCache:
+    """Bounded LRU map from (genome bytes, course seed) to the (fitness, score, survival steps) it earned.
+
+    A bird's flight only depends on its genome and the course, so an unchanged
+    genome on an already flown course can reuse its stored result.
+    """
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(genome, course_seed):
+        return genome.tobytes(), course_seed
+
+    def get(self, key):
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self.entries)
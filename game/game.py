@@ -1,38 +1,35 @@
 import pygame
-import os
-from .bird import Bird
-from .pipe import Pipe
+import time
+from .assets import load_image
+from .engine import GameEngine
 from .ui import UI
 from .network_visualizer import NetworkVisualizer
+from .bird_renderer import BirdRenderer
 
-class FlappyBirdGame:
-    def __init__(self, width=800, height=900, genetic_algorithm=None):
-        self.width = width
-        self.height = height
-        self.game_height = 600
+class FlappyBirdGame(GameEngine):
+    def __init__(self, width=800, height=900, genetic_algorithm=None, profiler=None, metrics=None,
+                 decision_interval=1, fitness=None, courses=1, density_threshold=2000, highlight=0):
+        super().__init__(
+            width, height, genetic_algorithm, profiler=profiler, metrics=metrics,
+            decision_interval=decision_interval, fitness=fitness, courses=courses
+        )
         self.bottom_height = 300
         self.metrics_width = 300
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("flappy bird - genetic algo & neural network")
         
-        self.ga = genetic_algorithm
         self.clock = pygame.time.Clock()
-        self.running = True
-        
-        self.birds = []
-        self.pipes = []
-        self.pipe_distance = 300  
         
-        self.stats = {
-            'generation': 0,
-            'best_fitness': 0,
-            'alive_birds': 0,
-            'total_birds': 0,
-            'speed': 1
-        }
+        # None is "unlimited": simulate on a wall-clock budget and render at most render_fps
+        self.speeds = [1, 2, 5, 10, None]
+        self.unlimited = False
+        self.render_fps = 30
+        self.draw_time = 0
+        # Called before the restart button throws the population away, e.g. to checkpoint it
+        self.before_restart = None
         
-        self.game_speed = 1
         self.ui = UI(width, self.game_height, self.metrics_width, self.bottom_height)
+        self.bird_renderer = BirdRenderer(self.game_height, density_threshold, highlight)
         
         self.network_vis = NetworkVisualizer(
             self.metrics_width + 20,
@@ -41,91 +38,47 @@ class FlappyBirdGame:
             self.bottom_height - 20
         )
         
-        current_dir = os.path.dirname(os.path.dirname(__file__))
-        self.background = pygame.image.load(os.path.join(current_dir, "assets", "background.png")).convert()
-        self.background = pygame.transform.scale(self.background, (width, self.game_height))
-        
-        self.reset()
-
-    def reset(self):
-        self.birds.clear()
-        self.pipes.clear()
-        
-        for i in range(3):
-            x = 800 + i * self.pipe_distance
-            self.pipes.append(Pipe(x, self.game_height))
-            
-    def add_bird(self, index):
-        bird = Bird(150, self.height//2, index)
-        self.birds.append(bird)
-        return bird
-
-    def update(self):
-        for _ in range(self.game_speed):
-            for bird in self.birds:
-                if bird.alive:
-                    bird.update()
-                    if bird.y < 0 or bird.y > self.game_height - bird.height:
-                        bird.die()
-                    
-                    for pipe in self.pipes:
-                        if bird.alive:
-                            for rect in pipe.get_rects():
-                                if bird.get_rect().colliderect(rect):
-                                    bird.die()
-                            if (pipe.x + pipe.width < bird.x and 
-                                pipe.x + pipe.width > bird.x - bird.velocity and 
-                                pipe.x < bird.last_pipe_x):
-                                bird.score += 1
-                                bird.last_pipe_x = pipe.x
-                                print(f"Bird {bird.index} scored! Score: {bird.score}")
-            
-            for pipe in self.pipes:
-                pipe.update()
-
-        if self.pipes[0].x < -self.pipes[0].width:
-            self.pipes.pop(0)
-            last_pipe = self.pipes[-1]
-            self.pipes.append(Pipe(last_pipe.x + self.pipe_distance, self.game_height))
-            
-        closest_pipe = None
-        min_distance = float('inf')
-        for pipe in self.pipes:
-            if pipe.x + pipe.width > 150:
-                if pipe.x < min_distance:
-                    min_distance = pipe.x
-                    closest_pipe = pipe
-        return closest_pipe
+        self.background = load_image("background.png", (width, self.game_height), alpha=False)
 
     def draw(self):
-        self.screen.blit(self.background, (0, 0))
-        self.screen.fill((0, 0, 0), (0, self.game_height, self.width, self.bottom_height))
-        pygame.draw.line(self.screen, (100, 100, 100), (0, self.game_height), (self.width, self.game_height), 2)
-        pygame.draw.line(self.screen, (100, 100, 100), (self.metrics_width, self.game_height), (self.metrics_width, self.height), 2)
+        profiler = self.profiler
+        with profiler.phase('draw_background'):
+            self.screen.blit(self.background, (0, 0))
+            self.screen.fill((0, 0, 0), (0, self.game_height, self.width, self.bottom_height))
+            pygame.draw.line(self.screen, (100, 100, 100), (0, self.game_height), (self.width, self.game_height), 2)
+            pygame.draw.line(self.screen, (100, 100, 100), (self.metrics_width, self.game_height), (self.metrics_width, self.height), 2)
         
-        for pipe in self.pipes:
-            pipe.draw(self.screen)
-        for bird in self.birds:
-            bird.draw(self.screen)
+        with profiler.phase('draw_pipes'):
+            for pipe in self.pipes:
+                pipe.draw(self.screen)
+        with profiler.phase('draw_birds'):
+            # Only birds on the first course fly through the pipes on screen
+            population = self.population
+            slots = population.active
+            if self.n_courses > 1:
+                slots = slots[population.course[slots] == 0]
+            scores = None
+            if self.bird_renderer.highlight and self.bird_renderer.dense(len(slots)):
+                scores = self.fitness(population, slots, self.get_closest_pipe())
+            self.bird_renderer.draw(self.screen, population, slots, scores)
             
-        self.stats['alive_birds'] = sum(1 for bird in self.birds if bird.alive)
+        self.stats['alive_birds'] = self.population.n_active
         self.stats['total_birds'] = len(self.birds)
             
-        alive_bird = next((bird for bird in self.birds if bird.alive), None)
-        if alive_bird and len(self.pipes) > 0:
-            closest_pipe = next((p for p in self.pipes if p.x + p.width > 150), None)
-            if closest_pipe:
-                horizontal_distance = (closest_pipe.x + closest_pipe.width - alive_bird.x) / 300
-                height_difference = (alive_bird.y - (closest_pipe.gap_y + closest_pipe.gap_height/2)) / 200
-                velocity = alive_bird.velocity / 8
-                inputs = [horizontal_distance, height_difference, velocity]
-                network = self.ga.population[alive_bird.index]
-                output = network.forward(inputs)
+        # Reuse the activations from the batched inference step instead of a second forward pass
+        with profiler.phase('draw_network'):
+            if self.ga.focus_index is not None:
+                network = self.ga.population[self.ga.focus_index]
                 self.network_vis.generation = self.ga.generation
-                self.network_vis.draw(self.screen, network, inputs, output)
+                self.network_vis.draw(self.screen, network, network.last_inputs, network.last_output)
 
-        self.ui.draw(self.screen, self.stats)
-        pygame.display.flip()
+        with profiler.phase('draw_ui'):
+            self.ui.draw(self.screen, self.stats)
+            self.ui.draw_fitness_history(self.screen, self.metrics)
+            if profiler.enabled:
+                self.ui.draw_profile(self.screen, profiler.summary())
+        with profiler.phase('flip'):
+            pygame.display.flip()
 
     def run_frame(self):
         closest_pipe = None
@@ -133,26 +86,28 @@ class FlappyBirdGame:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                self.profiler.enabled = not self.profiler.enabled
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 pos = pygame.mouse.get_pos()
                 button = self.ui.handle_click(pos)
                 if button == 'pause':
                     self.ui.paused = not self.ui.paused
                 elif button == 'speed':
-                    speeds = [1, 2, 5, 10]
-                    current_index = speeds.index(self.game_speed) if self.game_speed in speeds else 0
-                    self.game_speed = speeds[(current_index + 1) % len(speeds)]
-                    self.stats['speed'] = self.game_speed
+                    current = None if self.unlimited else self.game_speed
+                    current_index = self.speeds.index(current) if current in self.speeds else 0
+                    speed = self.speeds[(current_index + 1) % len(self.speeds)]
+                    self.unlimited = speed is None
+                    self.game_speed = speed or 1
+                    self.stats['speed'] = speed
                 elif button == 'restart':
+                    if self.before_restart:
+                        self.before_restart()
                     self.ga.generation = 1
                     self.ga.best_fitness = 0
                     self.ga.create_population()
                     
-                    self.reset()
-                    self.birds.clear()
-                    
-                    for i in range(self.ga.population_size):
-                        self.add_bird(i)
+                    self.spawn_population()
                     
                     self.stats.update({
                         'generation': 1,
@@ -160,13 +115,22 @@ class FlappyBirdGame:
                         'speed': 1
                     })
                     self.game_speed = 1
+                    self.unlimited = False
 
-        if not self.ui.paused:
-            closest_pipe = self.update()
+        if self.ui.paused:
+            closest_pipe = self.get_closest_pipe()
+        elif self.unlimited:
+            # Frames are skipped: keep stepping until this frame's time budget, minus drawing, is spent
+            deadline = time.perf_counter() + 1 / self.render_fps - self.draw_time
+            closest_pipe = self.step()
+            while time.perf_counter() < deadline:
+                closest_pipe = self.step()
         else:
-            closest_pipe = next((p for p in self.pipes if p.x + p.width > 150), None)
+            closest_pipe = self.step()
         
+        draw_start = time.perf_counter()
         self.draw()
-        self.clock.tick(60)
+        self.draw_time = time.perf_counter() - draw_start
+        self.clock.tick(self.render_fps if self.unlimited else 60)
         
         return closest_pipe, self.running
\ No newline at end of file
@@ -0,0 +1,61 @@
+import json
+import queue
+import threading
+from collections import deque
+import numpy as np
+
+class JsonLinesWriter:
+    """Append records to a JSON-lines file from a background thread, flushing whenever the queue drains"""
+    def __init__(self, path):
+        self.file = open(path, 'a', buffering=1 << 16)
+        self.queue = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def write(self, record):
+        self.queue.put(record)
+
+    def _run(self):
+        while True:
+            record = self.queue.get()
+            if record is None:
+                break
+            self.file.write(json.dumps(record) + '\n')
+            if self.queue.empty():
+                self.file.flush()
+        self.file.close()
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+class TrainingMetrics:
+    """Per-generation training summaries kept in a bounded ring buffer and optionally streamed to JSON lines"""
+    def __init__(self, path=None, history=500):
+        self.history = deque(maxlen=history)
+        self.writer = JsonLinesWriter(path) if path else None
+        # Bumped on every record so views can tell when their cached rendering is stale
+        self.version = 0
+
+    def record_generation(self, generation, fitness, score, survival_steps, wall_time, best_fitness):
+        record = {
+            'generation': int(generation),
+            'best_fitness': float(fitness.max()),
+            'mean_fitness': float(fitness.mean()),
+            'median_fitness': float(np.median(fitness)),
+            'max_score': float(score.max()),
+            'mean_survival_steps': float(survival_steps.mean()),
+            'max_survival_steps': float(survival_steps.max()),
+            'wall_time': round(wall_time, 4),
+            'best_fitness_overall': float(best_fitness)
+        }
+        self.history.append(record)
+        self.version += 1
+        if self.writer:
+            self.writer.write(record)
+        return record
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+            self.writer = None
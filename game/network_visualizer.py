@@ -7,95 +7,123 @@ class NetworkVisualizer:
         self.y = y
         self.width = width
         self.height = height
-        
-        self.NODE_OUTLINE = (255, 255, 255)  
-        self.POSITIVE_COLOR = (255, 255, 255)  
-        self.NEGATIVE_COLOR = (255, 0, 0)  
-        self.POSITIVE_WEIGHT_COLOR = (255, 255, 255, 128) 
-        self.NEGATIVE_WEIGHT_COLOR = (255, 0, 0, 128)  
-        self.NODE_RADIUS = 12  
-        self.BACKGROUND_COLOR = (20, 20, 20)  
-        
-        self.layer_spacing = width // 3
-        self.input_layer_x = x + self.layer_spacing * 0.5
-        self.hidden_layer_x = x + self.layer_spacing * 1.5
-        self.output_layer_x = x + self.layer_spacing * 2.5
-        
-    def draw(self, screen, network, inputs, output):
-        pygame.draw.rect(screen, self.BACKGROUND_COLOR, 
-                        (self.x, self.y, self.width, self.height))
-        pygame.draw.rect(screen, (50, 50, 50), 
-                        (self.x, self.y, self.width, self.height), 1)
-        
-        weights = network.get_weights()
-        w1, w2 = weights['w1'], weights['w2']
-        hidden_activations = network.last_hidden_activations if hasattr(network, 'last_hidden_activations') else None
-        
-        input_spacing = self.height // (len(inputs) + 1)
-        hidden_spacing = self.height // (w1.shape[1] + 1)
-        
-        input_nodes = [(self.input_layer_x, self.y + (i+1) * input_spacing) 
-                      for i in range(len(inputs))]
-        hidden_nodes = [(self.hidden_layer_x, self.y + (i+1) * hidden_spacing) 
-                       for i in range(w1.shape[1])]
-        output_nodes = [(self.output_layer_x, self.y + self.height//2)]
-        
-        for i, input_pos in enumerate(input_nodes):
-            for j, hidden_pos in enumerate(hidden_nodes):
-                weight = w1[i, j]
-                color = self.POSITIVE_WEIGHT_COLOR if weight > 0 else self.NEGATIVE_WEIGHT_COLOR
-                alpha = int(min(abs(weight) * 255, 255))
-                pygame.draw.line(screen, (*color[:3], alpha), input_pos, hidden_pos, 1)  
-        
-        for i, hidden_pos in enumerate(hidden_nodes):
-            for output_pos in output_nodes:
-                weight = w2[i, 0]
-                color = self.POSITIVE_WEIGHT_COLOR if weight > 0 else self.NEGATIVE_WEIGHT_COLOR
-                alpha = int(min(abs(weight) * 255, 255))
-                pygame.draw.line(screen, (*color[:3], alpha), hidden_pos, output_pos, 1)  
-        def draw_neuron(pos, value=None):
-            pygame.draw.circle(screen, self.NODE_OUTLINE, pos, self.NODE_RADIUS, 1)  
-            
-            if value is not None:
-                fill_color = self.POSITIVE_COLOR if value >= 0 else self.NEGATIVE_COLOR
-                pygame.draw.circle(screen, fill_color, pos, self.NODE_RADIUS - 1)
-                
-                font = pygame.font.SysFont('Arial', 10)  
-                text = font.render(f"{value:.2f}", True, (0, 0, 0) if value >= 0 else (255, 255, 255))
-                text_rect = text.get_rect(center=pos)
-                screen.blit(text, text_rect)
-        
-        for i, pos in enumerate(input_nodes):
-            draw_neuron(pos, inputs[i])
 
-        if hidden_activations is not None:
-            for i, pos in enumerate(hidden_nodes):
-                draw_neuron(pos, hidden_activations[i])
-        else:
-            for pos in hidden_nodes:
-                draw_neuron(pos)
-
-        for pos in output_nodes:
-            draw_neuron(pos, output)
-        
-        font = pygame.font.SysFont('Arial', 12)  
-        gen_text = font.render(
-            f"Generation: {self.generation}, Neurons: {len(hidden_nodes)}, Connections: {len(input_nodes)*len(hidden_nodes) + len(hidden_nodes)}", 
+        self.NODE_OUTLINE = (255, 255, 255)
+        self.POSITIVE_COLOR = (255, 255, 255)
+        self.NEGATIVE_COLOR = (255, 0, 0)
+        self.POSITIVE_WEIGHT_COLOR = (255, 255, 255, 128)
+        self.NEGATIVE_WEIGHT_COLOR = (255, 0, 0, 128)
+        self.NODE_RADIUS = 12
+        self.BACKGROUND_COLOR = (20, 20, 20)
+
+        pygame.font.init()
+        self.node_font = pygame.font.SysFont('Arial', 10)
+        self.info_font = pygame.font.SysFont('Arial', 12)
+
+        # Background, weights and labels only change with the shown genome, so they are
+        # pre-rendered once per genome/generation and blitted every frame
+        self.static_layer = None
+        self.static_key = None
+
+        # Rendered neuron values, bounded since activations are shown to two decimals
+        self.label_cache = {}
+        self.max_labels = 1024
+
+        self.generation = 0
+
+    def layout(self, layers):
+        """Node centres per layer, columns spread evenly across the panel, and a node radius that fits them"""
+        # The bottom strip is kept free for the info line and legend
+        height = self.height - 25
+        layer_spacing = self.width / len(layers)
+        radius = max(2, min(self.NODE_RADIUS, int(height / (max(layers) + 1) / 2) - 1))
+        columns = []
+        for column, size in enumerate(layers):
+            x = self.x + layer_spacing * (column + 0.5)
+            spacing = height / (size + 1)
+            columns.append([(x, self.y + (i + 1) * spacing) for i in range(size)])
+        return columns, radius
+
+    def render_static(self, network):
+        """Draw background, weight lines, node outlines and labels onto a panel-sized surface"""
+        surface = pygame.Surface((self.width, self.height))
+        surface.fill(self.BACKGROUND_COLOR)
+        pygame.draw.rect(surface, (50, 50, 50), (0, 0, self.width, self.height), 1)
+        offset = (self.x, self.y)
+
+        def local(pos):
+            return (pos[0] - offset[0], pos[1] - offset[1])
+
+        columns, radius = self.layout(network.layers)
+
+        for weights, sources, targets in zip(network.get_weights()['weights'], columns[:-1], columns[1:]):
+            for i, source in enumerate(sources):
+                for j, target in enumerate(targets):
+                    weight = weights[i, j]
+                    color = self.POSITIVE_WEIGHT_COLOR if weight > 0 else self.NEGATIVE_WEIGHT_COLOR
+                    alpha = int(min(abs(weight) * 255, 255))
+                    pygame.draw.line(surface, (*color[:3], alpha), local(source), local(target), 1)
+
+        for column in columns:
+            for pos in column:
+                pygame.draw.circle(surface, self.NODE_OUTLINE, local(pos), radius, 1)
+
+        layers = network.layers
+        gen_text = self.info_font.render(
+            f"Generation: {self.generation}, Layers: {'-'.join(map(str, layers))}, "
+            f"Neurons: {sum(layers[1:-1])}, Connections: {sum(a * b for a, b in zip(layers[:-1], layers[1:]))}",
             True, (150, 150, 150)
         )
-        screen.blit(gen_text, (self.x + 10, self.y + self.height - 20))
-
-
-        legend_y = self.y + self.height - 20
-        pygame.draw.line(screen, self.NEGATIVE_WEIGHT_COLOR[:3], 
-                        (self.x + self.width - 50, legend_y), 
-                        (self.x + self.width - 35, legend_y), 1)
-        pygame.draw.line(screen, self.POSITIVE_WEIGHT_COLOR[:3], 
-                        (self.x + self.width - 30, legend_y), 
-                        (self.x + self.width - 15, legend_y), 1)
-        
-        legend_font = pygame.font.SysFont('Arial', 10)
-        neg_text = legend_font.render("-ve", True, (150, 150, 150))
-        pos_text = legend_font.render("+ve", True, (150, 150, 150))
-        screen.blit(neg_text, (self.x + self.width - 50, legend_y - 15))
-        screen.blit(pos_text, (self.x + self.width - 30, legend_y - 15))
\ No newline at end of file
+        surface.blit(gen_text, (10, self.height - 20))
+
+        legend_y = self.height - 20
+        pygame.draw.line(surface, self.NEGATIVE_WEIGHT_COLOR[:3],
+                        (self.width - 50, legend_y),
+                        (self.width - 35, legend_y), 1)
+        pygame.draw.line(surface, self.POSITIVE_WEIGHT_COLOR[:3],
+                        (self.width - 30, legend_y),
+                        (self.width - 15, legend_y), 1)
+
+        neg_text = self.node_font.render("-ve", True, (150, 150, 150))
+        pos_text = self.node_font.render("+ve", True, (150, 150, 150))
+        surface.blit(neg_text, (self.width - 50, legend_y - 15))
+        surface.blit(pos_text, (self.width - 30, legend_y - 15))
+        return surface
+
+    def label(self, value):
+        key = (f"{value:.2f}", value >= 0)
+        surface = self.label_cache.get(key)
+        if surface is None:
+            if len(self.label_cache) >= self.max_labels:
+                self.label_cache.clear()
+            surface = self.node_font.render(key[0], True, (0, 0, 0) if value >= 0 else (255, 255, 255))
+            self.label_cache[key] = surface
+        return surface
+
+    def draw(self, screen, network, inputs, output):
+        key = (self.generation, network.layers, network.genome.tobytes())
+        if key != self.static_key:
+            self.static_layer = self.render_static(network)
+            self.static_key = key
+        screen.blit(self.static_layer, (self.x, self.y))
+
+        columns, radius = self.layout(network.layers)
+        hidden_activations = getattr(network, 'last_hidden_activations', None)
+        values = [inputs]
+        if hidden_activations is not None:
+            values += hidden_activations
+        values.append([output])
+        if len(values) < len(columns):
+            # Hidden activations are unknown until the network has made a decision
+            values = [inputs, [output]]
+            columns = [columns[0], columns[-1]]
+
+        # Values are only written inside nodes big enough to hold them
+        show_labels = radius >= self.NODE_RADIUS - 2
+        for column, column_values in zip(columns, values):
+            for pos, value in zip(column, column_values):
+                fill_color = self.POSITIVE_COLOR if value >= 0 else self.NEGATIVE_COLOR
+                pygame.draw.circle(screen, fill_color, pos, radius - 1)
+                if show_labels:
+                    text = self.label(value)
+                    screen.blit(text, text.get_rect(center=pos))
@@ -0,0 +1,170 @@
+import numpy as np
+
+class BirdPopulation:
+    """Structure-of-arrays state for every bird, stepped as whole-population array operations"""
+    def __init__(self, capacity=0, x=150):
+        self.x = x
+
+        # Physics
+        self.gravity = 0.4
+        self.flap_strength = -7
+        self.max_velocity = 8
+
+        # Dimensions
+        self.width = 34
+        self.height = 24
+
+        self.size = 0
+        self.n_active = 0
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        self.capacity = capacity
+        self.y = np.zeros(capacity)
+        self.velocity = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.fitness = np.zeros(capacity)
+        self.score = np.zeros(capacity, dtype=np.int64)
+        self.distance = np.zeros(capacity, dtype=np.int64)
+        self.last_pipe_x = np.full(capacity, np.inf)
+        self.index = np.zeros(capacity, dtype=np.int64)
+        self.course = np.zeros(capacity, dtype=np.int64)
+        # Slots of live birds in ascending order; only the first n_active entries are valid
+        self.active_slots = np.zeros(capacity, dtype=np.int64)
+
+    @property
+    def active(self):
+        """Slots of every live bird"""
+        return self.active_slots[:self.n_active]
+
+    def clear(self):
+        self.size = 0
+        self.n_active = 0
+
+    def add(self, y, index, course=0):
+        """Append a live bird flying the given course and return its slot"""
+        if self.size == self.capacity:
+            self._grow(max(1, self.capacity * 2))
+
+        slot = self.size
+        self.y[slot] = y
+        self.velocity[slot] = 0
+        self.alive[slot] = True
+        self.fitness[slot] = 0
+        self.score[slot] = 0
+        self.distance[slot] = 0
+        self.last_pipe_x[slot] = np.inf
+        self.index[slot] = index
+        self.course[slot] = course
+        self.active_slots[self.n_active] = slot
+        self.n_active += 1
+        self.size += 1
+        return slot
+
+    def add_many(self, y, indices, course=0):
+        """Append one live bird per network index, all flying the given course"""
+        count = len(indices)
+        if self.size + count > self.capacity:
+            self._grow(max(self.size + count, self.capacity * 2))
+
+        slots = np.arange(self.size, self.size + count)
+        self.y[slots] = y
+        self.velocity[slots] = 0
+        self.alive[slots] = True
+        self.fitness[slots] = 0
+        self.score[slots] = 0
+        self.distance[slots] = 0
+        self.last_pipe_x[slots] = np.inf
+        self.index[slots] = indices
+        self.course[slots] = course
+        self.active_slots[self.n_active:self.n_active + count] = slots
+        self.n_active += count
+        self.size += count
+
+    def _grow(self, capacity):
+        old = (self.y, self.velocity, self.alive, self.fitness,
+               self.score, self.distance, self.last_pipe_x, self.index, self.course, self.active_slots)
+        self.allocate(capacity)
+        new = (self.y, self.velocity, self.alive, self.fitness,
+               self.score, self.distance, self.last_pipe_x, self.index, self.course, self.active_slots)
+        for src, dst in zip(old, new):
+            dst[:len(src)] = src
+
+    def rebuild_active(self):
+        """Recompute the live-slot index after alive was written directly"""
+        slots = np.flatnonzero(self.alive[:self.size])
+        self.n_active = len(slots)
+        self.active_slots[:self.n_active] = slots
+
+    def kill(self, slots):
+        """Mark birds dead and drop them from the live-slot index"""
+        self.alive[slots] = False
+        active = self.active
+        keep = self.alive[active]
+        self.n_active = np.count_nonzero(keep)
+        active[:self.n_active] = active[keep]
+
+    def flap(self, mask):
+        """Set flap velocity for every live bird selected by mask"""
+        n = self.size
+        self.velocity[:n][mask & self.alive[:n]] = self.flap_strength
+
+    def step(self, pipe_x, pipe_gap_y, pipe_width, gap_height, game_height):
+        """Advance every live bird by one physics step against pipes sorted by x; returns the slots of birds that died.
+
+        pipe_gap_y is (courses, pipes): each bird collides with the gaps of its own course.
+        """
+        live = self.move(game_height)
+        return self.collide(live, pipe_x, pipe_gap_y, pipe_width, gap_height, game_height)
+
+    def move(self, game_height):
+        """Apply gravity and velocity to live birds; returns which of the active slots are still inside the screen"""
+        slots = self.active
+        velocity = np.clip(self.velocity[slots] + self.gravity, -self.max_velocity, self.max_velocity)
+        y = self.y[slots] + velocity
+        self.velocity[slots] = velocity
+        self.y[slots] = y
+        self.distance[slots] += 1
+
+        return ~((y < 0) | (y > game_height - self.height))
+
+    def collide(self, live, pipe_x, pipe_gap_y, pipe_width, gap_height, game_height):
+        """Kill birds hitting a pipe and score birds passing one; returns the slots of birds that died this step"""
+        slots = self.active
+        velocity = self.velocity[slots]
+        pipe_gap_y = pipe_gap_y[self.course[slots]]
+
+        # AABB test against the top and bottom rect of every pipe, with y truncated like pygame.Rect
+        bird_top = np.trunc(self.y[slots])[:, None]
+        bird_bottom = bird_top + self.height
+        bottom_y = pipe_gap_y + gap_height
+        overlap_x = (self.x < pipe_x + pipe_width) & (self.x + self.width > pipe_x)
+        hit_top = (bird_top < pipe_gap_y) & (bird_bottom > 0)
+        hit_bottom = (bird_top < game_height) & (bird_bottom > bottom_y)
+        hits = live[:, None] & overlap_x & (hit_top | hit_bottom)
+
+        # A bird is only checked against later pipes while it is still alive
+        hit_before = np.cumsum(hits, axis=1) - hits > 0
+        checked = live[:, None] & ~hit_before
+
+        passed = (
+            checked
+            & (pipe_x + pipe_width < self.x)
+            & (pipe_x + pipe_width > self.x - velocity[:, None])
+            & (pipe_x < self.last_pipe_x[slots, None])
+        )
+        # Pipes are sorted by x, so only the first passed pipe can be below last_pipe_x
+        scored = passed.any(axis=1)
+        scored_slots = slots[scored]
+        self.score[scored_slots] += 1
+        self.last_pipe_x[scored_slots] = pipe_x[passed[scored].argmax(axis=1)]
+
+        survived = live & ~hits.any(axis=1)
+        if survived.all():
+            return slots[:0].copy()
+        died = slots[~survived]
+        self.alive[died] = False
+        # Compact the live-slot index in place, keeping it in slot order
+        self.n_active = np.count_nonzero(survived)
+        slots[:self.n_active] = slots[survived]
+        return died
@@ -0,0 +1,81 @@
+import csv
+import time
+from collections import deque
+from contextlib import nullcontext
+import numpy as np
+
+# Shared no-op context returned while profiling is off, so instrumented code pays one call
+_DISABLED = nullcontext()
+
+class _PhaseTimer:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+
+class Profiler:
+    """Wall-clock timing of named hot-path phases.
+
+    Keeps a rolling window of recent durations per phase for on-screen
+    averages/percentiles, and per-generation totals that are appended to a
+    CSV file (one row per generation and phase) when csv_path is set.
+    """
+    def __init__(self, enabled=False, window=240, csv_path=None):
+        self.enabled = enabled
+        self.window = window
+        self.csv_path = csv_path
+        self.samples = {}
+        self.totals = {}
+        self.calls = {}
+        self._csv_file = None
+        self._csv_writer = None
+
+    def phase(self, name):
+        if not self.enabled:
+            return _DISABLED
+        return _PhaseTimer(self, name)
+
+    def record(self, name, seconds):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(seconds)
+        self.totals[name] = self.totals.get(name, 0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def summary(self):
+        """Rolling (mean, p50, p95) per phase in milliseconds"""
+        result = {}
+        for name, samples in self.samples.items():
+            ms = np.array(samples) * 1000
+            result[name] = (ms.mean(), np.percentile(ms, 50), np.percentile(ms, 95))
+        return result
+
+    def end_generation(self, generation):
+        """Write this generation's per-phase totals to the CSV and start new totals"""
+        if self.csv_path and self.totals:
+            if self._csv_writer is None:
+                self._csv_file = open(self.csv_path, 'w', newline='')
+                self._csv_writer = csv.writer(self._csv_file)
+                self._csv_writer.writerow(['generation', 'phase', 'calls', 'total_ms', 'mean_ms'])
+            for name, total in self.totals.items():
+                calls = self.calls[name]
+                self._csv_writer.writerow(
+                    [generation, name, calls, f"{total * 1000:.3f}", f"{total * 1000 / calls:.4f}"]
+                )
+            self._csv_file.flush()
+        self.totals.clear()
+        self.calls.clear()
+
+    def close(self):
+        if self._csv_file:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
@@ -15,6 +15,7 @@ class UI:
         pygame.font.init()
         self.font = pygame.font.SysFont('Arial', 24)
         self.small_font = pygame.font.SysFont('Arial', 16)
+        self.profile_font = pygame.font.SysFont('Arial', 13)
         
         button_width = 100
         speed_button_width = 120 
@@ -49,6 +50,11 @@ class UI:
         
         self.paused = False
         
+        # Fitness chart is re-rendered only when a generation finishes
+        self.history_size = (240, 110)
+        self.history_surface = None
+        self.history_version = None
+        
     def draw(self, screen, stats):
         mouse_pos = pygame.mouse.get_pos()
         for button_name, button_rect in self.buttons.items():
@@ -66,7 +72,7 @@ class UI:
             elif button_name == 'restart':
                 text = "Restart"
             else:  
-                text = f"Speed: {stats['speed']}x"
+                text = f"Speed: {stats['speed']}x" if stats['speed'] else "Speed: Max"
                 
             text_surface = self.font.render(text, True, self.WHITE)
             text_rect = text_surface.get_rect(center=button_rect.center)
@@ -91,6 +97,65 @@ class UI:
             screen.blit(text_surface, text_rect)
             metrics_y += 40
         
+    def draw_profile(self, screen, summary):
+        """Draw rolling per-phase timings (ms) as a translucent table over the top-left of the game"""
+        rows = [("phase", "mean", "p50", "p95")]
+        for name, (mean, p50, p95) in sorted(summary.items(), key=lambda item: -item[1][0]):
+            rows.append((name, f"{mean:.2f}", f"{p50:.2f}", f"{p95:.2f}"))
+        
+        line_height = self.profile_font.get_linesize()
+        panel = pygame.Surface((300, line_height * len(rows) + 10))
+        panel.fill(self.BLACK)
+        panel.set_alpha(180)
+        screen.blit(panel, (5, 5))
+        
+        column_right = [None, 200, 250, 300]
+        for i, row in enumerate(rows):
+            y = 10 + i * line_height
+            for text, right in zip(row, column_right):
+                text_surface = self.profile_font.render(text, True, self.WHITE)
+                x = 10 if right is None else right - text_surface.get_width()
+                screen.blit(text_surface, (x, y))
+        
+    def draw_fitness_history(self, screen, metrics):
+        """Draw best/mean fitness per generation in the top-right of the game from a cached surface"""
+        if not metrics.history:
+            return
+        if metrics.version != self.history_version:
+            self.history_surface = self.render_fitness_history(metrics.history)
+            self.history_version = metrics.version
+        screen.blit(self.history_surface, (self.width - self.history_size[0] - 5, 5))
+    
+    def render_fitness_history(self, history):
+        width, height = self.history_size
+        surface = pygame.Surface((width, height))
+        surface.fill(self.BLACK)
+        surface.set_alpha(180)
+        
+        best = [record['best_fitness'] for record in history]
+        mean = [record['mean_fitness'] for record in history]
+        low, high = min(min(mean), 0), max(max(best), 1)
+        
+        top, bottom = 22, height - 8
+        
+        def points(values):
+            step = (width - 20) / max(len(values) - 1, 1)
+            return [
+                (10 + i * step, bottom - (value - low) / (high - low) * (bottom - top))
+                for i, value in enumerate(values)
+            ]
+        
+        if len(history) > 1:
+            pygame.draw.lines(surface, self.GRAY, False, points(mean), 1)
+            pygame.draw.lines(surface, self.WHITE, False, points(best), 2)
+        
+        title = self.profile_font.render(
+            f"Fitness, gen {history[0]['generation']}-{history[-1]['generation']} (max {high:.0f})",
+            True, self.WHITE
+        )
+        surface.blit(title, (8, 4))
+        return surface
+    
     def _draw_button(self, screen, rect, text):
         pygame.draw.rect(screen, self.BLUE, rect)
         pygame.draw.rect(screen, self.BLACK, rect, 2)
@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+import time
+import numpy as np
+from ai.policy_server import HEADER, INPUT_DTYPE, latency_summary
+
+async def client(args, seed, latencies):
+    """One game client: send random states in windows of --pipeline requests and time every reply"""
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+    n_inputs, = HEADER.unpack(await reader.readexactly(HEADER.size))
+    rng = np.random.default_rng(seed)
+
+    flaps = 0
+    for _ in range(args.requests // args.pipeline):
+        inputs = rng.standard_normal((args.pipeline, n_inputs)).astype(INPUT_DTYPE)
+        start = time.perf_counter()
+        writer.write(inputs.tobytes())
+        replies = await reader.readexactly(args.pipeline)
+        latencies.extend([time.perf_counter() - start] * args.pipeline)
+        flaps += sum(replies)
+    writer.close()
+    await writer.wait_closed()
+    return flaps
+
+async def run(args):
+    latencies = []
+    start = time.perf_counter()
+    flaps = await asyncio.gather(*(client(args, seed, latencies) for seed in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    p50, p99 = latency_summary(latencies)
+    print(
+        f"{len(latencies)} requests from {args.clients} clients in {elapsed:.2f}s: "
+        f"{len(latencies) / elapsed:,.0f} req/s, latency p50 {p50:.2f} ms p99 {p99:.2f} ms, "
+        f"{sum(flaps) / max(len(latencies), 1):.0%} flaps"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test serve.py with many concurrent stand-in game clients")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--unix', metavar='PATH', help="connect to a Unix socket instead of TCP")
+    parser.add_argument('--clients', type=int, default=100, help="concurrent connections")
+    parser.add_argument('--requests', type=int, default=1000, help="requests sent by each client")
+    parser.add_argument('--pipeline', type=int, default=1, help="requests each client sends before awaiting replies")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
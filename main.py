@@ -1,17 +1,65 @@
 import pygame
+import argparse
 import os
 from game.game import FlappyBirdGame
 from ai.genetic import GeneticAlgorithm
+from ai.evolution_strategies import EvolutionStrategies
+from ai.checkpoint import CheckpointWriter, load_checkpoint
+from game.profiler import Profiler
+from game.metrics import TrainingMetrics
+from game.fitness import FITNESS_FUNCTIONS
+from ai.neural_network import ACTIVATIONS
 
 def main():
-    ga = GeneticAlgorithm(population_size=50)
-    game = FlappyBirdGame(genetic_algorithm=ga)
+    parser = argparse.ArgumentParser(description="Watch Flappy Bird networks train")
+    parser.add_argument('--resume', metavar='PATH', help="continue training from a checkpoint")
+    parser.add_argument('--checkpoint', metavar='PATH', default='checkpoint.npz', help="where checkpoints are written")
+    parser.add_argument('--checkpoint-every', type=int, default=5, help="generations between checkpoints")
+    parser.add_argument('--profile', action='store_true', help="start with the phase profiler on (toggle with P)")
+    parser.add_argument('--profile-csv', metavar='PATH', help="write per-generation phase timings to a CSV file")
+    parser.add_argument('--metrics', metavar='PATH', help="append per-generation training metrics as JSON lines")
+    parser.add_argument('--decision-interval', type=int, default=1, help="physics steps between network decisions")
+    parser.add_argument('--fitness', choices=FITNESS_FUNCTIONS, default='gap', help="how a bird's flight is scored")
+    parser.add_argument('--hidden', type=int, nargs='+', default=[6], metavar='N', help="sizes of the hidden layers")
+    parser.add_argument('--activation', choices=ACTIVATIONS, default='sigmoid', help="activation of the hidden layers")
+    parser.add_argument('--lookahead', action='store_true', help="also feed the networks the pipe after the next one")
+    parser.add_argument('--optimizer', choices=('ga', 'es'), default='ga',
+                        help="genetic algorithm or OpenAI-style evolution strategies")
+    parser.add_argument('--population', type=int, default=50, help="birds per generation")
+    parser.add_argument('--density-threshold', type=int, default=2000,
+                        help="above this many birds on screen, draw a density strip instead of sprites")
+    parser.add_argument('--highlight', type=int, default=0, metavar='K',
+                        help="draw the K fittest live birds as sprites over the density strip")
+    args = parser.parse_args()
+
+    layers = (5 if args.lookahead else 3, *args.hidden, 1)
+    activations = (args.activation,) * len(args.hidden) + ('sigmoid',)
+    optimizer = EvolutionStrategies if args.optimizer == 'es' else GeneticAlgorithm
+    ga = optimizer(population_size=args.population, layers=layers, activations=activations)
+    if args.resume:
+        load_checkpoint(args.resume, ga)
+    profiler = Profiler(enabled=args.profile or bool(args.profile_csv), csv_path=args.profile_csv)
+    metrics = TrainingMetrics(args.metrics)
+    game = FlappyBirdGame(
+        genetic_algorithm=ga, profiler=profiler, metrics=metrics, decision_interval=args.decision_interval,
+        fitness=FITNESS_FUNCTIONS[args.fitness], density_threshold=args.density_threshold, highlight=args.highlight
+    )
     
     for i in range(ga.population_size):
         game.add_bird(i)
     
-    game_speeds = [1, 2, 5, 10]
-    speed_index = 0
+    writer = CheckpointWriter(args.checkpoint)
+    last_checkpoint = ga.generation
+    # The run a restart throws away is kept next to the checkpoint, which the fresh run goes on to overwrite
+    root, ext = os.path.splitext(args.checkpoint)
+    restart_writer = CheckpointWriter(f"{root}.before-restart{ext}")
+
+    def before_restart():
+        nonlocal last_checkpoint
+        restart_writer.submit(ga)
+        last_checkpoint = 1
+
+    game.before_restart = before_restart
     
     pygame.init()
     while game.running:
@@ -22,40 +70,22 @@ def main():
         
         closest_pipe, running = game.run_frame()
         
-        alive_birds = False
-        for bird in game.birds:
-            if bird.alive:
-                alive_birds = True
-                if closest_pipe:
-                    dx = closest_pipe.x + closest_pipe.width - bird.x
-                    pipe_center = closest_pipe.gap_y + closest_pipe.gap_height/2
-                    dy = bird.y - pipe_center
-                    
-                    bird.fitness = (
-                        bird.score * 1000
-                        + (bird.distance / 100)
-                        - (abs(dy) / pipe_center) * 100
-                        + (50 if dx > 0 else 0)
-                    )
-                
-                ga.activate_brain(bird, closest_pipe)
-
-        if not alive_birds:
-            ga.evolve_population(game.birds)
-            game.reset()
-            
-            for i in range(ga.population_size):
-                bird = game.add_bird(i)
-                bird.y = game.height // 2
-                bird.velocity = 0
-        
         if game.running:
             pygame.display.set_caption(
                 f"Flappy Bird AI - Generation: {ga.generation} - "
-                f"Speed: {game.game_speed}x - "
+                f"Speed: {'Max' if game.unlimited else f'{game.game_speed}x'} - "
                 f"Best Fitness: {ga.best_fitness:.0f}"
             )
+        
+        if ga.generation - last_checkpoint >= args.checkpoint_every:
+            writer.submit(ga)
+            last_checkpoint = ga.generation
 
+    writer.submit(ga)
+    writer.close()
+    restart_writer.close()
+    profiler.close()
+    metrics.close()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+import argparse
+import asyncio
+from ai.checkpoint import load_checkpoint
+from ai.policy_server import PolicyServer
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve flap decisions of a checkpoint's best network to many clients")
+    parser.add_argument('checkpoint', help="checkpoint written by main.py or train.py")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--unix', metavar='PATH', help="listen on a Unix socket instead of TCP")
+    parser.add_argument('--max-batch', type=int, default=256, help="most requests answered by one forward pass")
+    parser.add_argument('--max-wait', type=float, default=1.0, help="milliseconds a batch waits to fill up")
+    parser.add_argument('--report-every', type=float, default=5.0, help="seconds between throughput/latency reports")
+    args = parser.parse_args()
+
+    ga = load_checkpoint(args.checkpoint)
+    if ga.best_network is None:
+        parser.error(f"{args.checkpoint} has no best network yet")
+    print(f"Serving the best network of generation {ga.best_generation} (fitness {ga.best_fitness:.0f}), "
+          f"layers {'-'.join(map(str, ga.best_network.layers))}")
+
+    async def run():
+        server = PolicyServer(ga.best_network, args.max_batch, args.max_wait / 1000)
+        await server.serve(args.host, args.port, args.unix, args.report_every)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import argparse
+import random
+import time
+import numpy as np
+from game.engine import GameEngine
+from ai.genetic import GeneticAlgorithm
+from ai.evolution_strategies import EvolutionStrategies
+from ai.parallel import ParallelEvaluator
+from ai.islands import IslandModel
+from ai.selection import SELECTION_STRATEGIES
+from ai.neural_network import ACTIVATIONS
+from ai.checkpoint import CheckpointWriter, load_checkpoint
+from game.profiler import Profiler
+from game.metrics import TrainingMetrics
+from game.fitness import FITNESS_FUNCTIONS
+from game.fitness_cache import FitnessCache
+
+def main():
+    parser = argparse.ArgumentParser(description="Train Flappy Bird networks headless, without a display or frame cap")
+    parser.add_argument('--generations', type=int, default=100, help="number of generations to train before exiting")
+    parser.add_argument('--population', type=int, default=50, help="birds per generation")
+    parser.add_argument('--max-steps', type=int, default=20000, help="physics steps after which a generation is cut off")
+    parser.add_argument('--workers', type=int, default=1, help="processes used to evaluate the population")
+    parser.add_argument('--islands', type=int, default=1, help="split the population into islands, one process each")
+    parser.add_argument('--migration-interval', type=int, default=5, help="generations between island migrations")
+    parser.add_argument('--migrants', type=int, default=2, help="best genomes each island sends to the next")
+    parser.add_argument('--seed', type=int, default=None, help="seed for the GA and pipe courses; random if omitted")
+    parser.add_argument('--resume', metavar='PATH', help="continue training from a checkpoint")
+    parser.add_argument('--checkpoint', metavar='PATH', default='checkpoint.npz', help="where checkpoints are written")
+    parser.add_argument('--checkpoint-every', type=int, default=10, help="generations between checkpoints")
+    parser.add_argument('--profile-csv', metavar='PATH', help="write per-generation phase timings to a CSV file")
+    parser.add_argument('--metrics', metavar='PATH', help="append per-generation training metrics as JSON lines")
+    parser.add_argument('--decision-interval', type=int, default=1, help="physics steps between network decisions")
+    parser.add_argument('--optimizer', choices=('ga', 'es'), default='ga',
+                        help="genetic algorithm or OpenAI-style evolution strategies")
+    parser.add_argument('--sigma', type=float, default=1.0, help="noise scale of the --optimizer es perturbations")
+    parser.add_argument('--learning-rate', type=float, default=0.1, help="Adam step size of --optimizer es")
+    parser.add_argument('--selection', choices=SELECTION_STRATEGIES, default='truncation', help="how parents are picked")
+    parser.add_argument('--tournament-size', type=int, default=3, help="entrants per tournament with --selection tournament")
+    parser.add_argument('--courses', type=int, default=1, help="seeded courses every genome flies; fitness is averaged")
+    parser.add_argument('--fixed-course', action='store_true', help="fly the same seeded course(s) every generation")
+    parser.add_argument('--fitness-cache', type=int, default=0, metavar='N',
+                        help="remember the fitness of up to N genomes per course and skip re-simulating them")
+    parser.add_argument('--fitness', choices=FITNESS_FUNCTIONS, default='gap', help="how a bird's flight is scored")
+    parser.add_argument('--hidden', type=int, nargs='+', default=[6], metavar='N', help="sizes of the hidden layers")
+    parser.add_argument('--activation', choices=ACTIVATIONS, default='sigmoid', help="activation of the hidden layers")
+    parser.add_argument('--dtype', choices=('float64', 'float32'), default='float64', help="genome storage precision")
+    parser.add_argument('--genome-file', metavar='PATH', help="keep the genome matrix in a memory-mapped file")
+    parser.add_argument('--lookahead', action='store_true', help="also feed the networks the pipe after the next one")
+    args = parser.parse_args()
+    if args.optimizer == 'es' and args.islands > 1:
+        parser.error("--islands only works with --optimizer ga")
+
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+    np.random.seed(seed)
+    print(f"Seed: {seed}")
+
+    layers = (5 if args.lookahead else 3, *args.hidden, 1)
+    activations = (args.activation,) * len(args.hidden) + ('sigmoid',)
+    if args.optimizer == 'es':
+        ga = EvolutionStrategies(
+            population_size=args.population, sigma=args.sigma, learning_rate=args.learning_rate,
+            layers=layers, activations=activations, dtype=args.dtype, genome_file=args.genome_file
+        )
+    else:
+        ga = GeneticAlgorithm(
+            population_size=args.population, selection=args.selection, tournament_size=args.tournament_size,
+            layers=layers, activations=activations, dtype=args.dtype, genome_file=args.genome_file
+        )
+    if args.resume:
+        load_checkpoint(args.resume, ga)
+    writer = CheckpointWriter(args.checkpoint)
+    profiler = Profiler(enabled=bool(args.profile_csv), csv_path=args.profile_csv)
+    metrics = TrainingMetrics(args.metrics)
+    cache = FitnessCache(args.fitness_cache) if args.fitness_cache else None
+
+    engine_options = {
+        'decision_interval': args.decision_interval,
+        'fitness': FITNESS_FUNCTIONS[args.fitness],
+        'courses': args.courses,
+        'fixed_course': args.fixed_course
+    }
+    evaluator = None
+    islands = None
+    if args.islands > 1:
+        # Every island keeps its own cache for its own slice of the population
+        islands = IslandModel(
+            ga, args.islands, args.migration_interval, args.migrants, seed, args.max_steps,
+            cache=cache, **engine_options
+        )
+        generations = islands.generations(args.generations)
+    else:
+        if args.workers > 1:
+            evaluator = ParallelEvaluator(
+                ga, args.workers, seed, args.max_steps, cache=cache, **engine_options
+            )
+            evaluate = evaluator.evaluate
+        else:
+            engine = GameEngine(genetic_algorithm=ga, seed=seed, profiler=profiler, cache=cache, **engine_options)
+
+            def evaluate():
+                engine.spawn_population()
+                engine.run(args.max_steps)
+                return engine.genome_stats()
+
+        def evolve():
+            for _ in range(args.generations):
+                gen_start = time.perf_counter()
+                with profiler.phase('evaluate'):
+                    fitness, score, survival_steps = evaluate()
+                with profiler.phase('evolve'):
+                    ga.evolve_population(fitness)
+                yield ga.generation - 1, fitness, score, survival_steps, time.perf_counter() - gen_start, ga.best_fitness
+
+        generations = evolve()
+
+    start = time.perf_counter()
+    try:
+        for generation, fitness, score, survival_steps, wall_time, best_fitness in generations:
+            profiler.end_generation(generation)
+            record = metrics.record_generation(generation, fitness, score, survival_steps, wall_time, best_fitness)
+            print(
+                f"Generation {record['generation']}: best {record['best_fitness']:.0f}, "
+                f"mean {record['mean_fitness']:.0f}, max score {record['max_score']:g} "
+                f"in {record['wall_time']:.2f}s - Best Fitness: {best_fitness:.0f}"
+            )
+            if generation % args.checkpoint_every == 0:
+                writer.submit(ga)
+    finally:
+        if evaluator:
+            evaluator.close()
+        if islands:
+            islands.close()
+        writer.submit(ga)
+        writer.close()
+        profiler.close()
+        metrics.close()
+
+    print(f"Trained {args.generations} generations in {time.perf_counter() - start:.1f}s")
+    if cache and not islands:
+        print(f"Fitness cache: {cache.hits} of {cache.hits + cache.misses} genomes reused")
+
+if __name__ == "__main__":
+    main()